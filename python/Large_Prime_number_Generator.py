@@ -1,3 +1,4 @@
+"""
 DART-69 PRIME GENERATOR - FORMULA BASED
 Instead of checking every number, use the dart-69 pattern to generate prime candidates directly.
 Filters out forbidden positions (every 3rd) automatically.
@@ -5,46 +6,344 @@ Filters out forbidden positions (every 3rd) automatically.
 This is MUCH faster than brute force checking every number!
 """
 
+import multiprocessing
+
+# Spawned batch workers import this module again - only the main process reports the engines
+_MAIN_PROCESS = multiprocessing.parent_process() is None
+
 try:
     import gmpy2
     from gmpy2 import is_prime
     GMPY2_AVAILABLE = True
-    print("✓ gmpy2 loaded - Fast primality testing enabled")
+    if _MAIN_PROCESS:
+        print("✓ gmpy2 loaded - Fast primality testing enabled")
 except ImportError:
-    print("⚠ gmpy2 not available - Using standard library")
+    if _MAIN_PROCESS:
+        print("⚠ gmpy2 not available - Using standard library")
     GMPY2_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+    if _MAIN_PROCESS:
+        print("✓ numpy loaded - Bit-packed sieve enabled")
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import get_num_threads, njit, prange, set_num_threads
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+    if _MAIN_PROCESS:
+        print("✓ numba loaded - Compiled candidate scanning enabled")
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+import bisect
+import concurrent.futures
+import contextlib
+import functools
+import io
+import itertools
 import math
+import os
 import time
 
+# Above this bound the sieve is impractical - fall back to per-candidate tests
+SIEVE_LIMIT = 2 ** 50
+
+# Compiled Miller-Rabin works on uint64 Montgomery form, which needs n < 2^63
+MONTGOMERY_LIMIT = 2 ** 63
+
+# Wheel turns per compiled scan call - bounds its flag matrix to ~50 MB
+SCAN_BLOCK_ROUNDS = 1 << 20
+
+@functools.lru_cache(maxsize=128)
+def _pi_pow(d):
+    """floor(π^d), computed once per d"""
+    if GMPY2_AVAILABLE:
+        return int(gmpy2.floor(gmpy2.const_pi() ** d))
+    return math.floor(math.pi ** d)
+
+@functools.lru_cache(maxsize=128)
 def get_dimension_range(d):
     """Calculate π-dimensional bounds"""
-    if GMPY2_AVAILABLE:
-        pi = gmpy2.const_pi()
-        min_n = int(gmpy2.floor(pi ** (d - 1))) + 1
-        max_n = int(gmpy2.floor(pi ** d))
-    else:
-        pi = math.pi
-        min_n = math.floor(pi ** (d - 1)) + 1
-        max_n = math.floor(pi ** d)
+    min_n = _pi_pow(d - 1) + 1
+    max_n = _pi_pow(d)
     
     return min_n, max_n
 
+# Small primes below 256 - one gcd with their product rejects most composites
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67,
+                 71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139, 149,
+                 151, 157, 163, 167, 173, 179, 181, 191, 193, 197, 199, 211, 223, 227, 229,
+                 233, 239, 241, 251)
+_SMALL_PRIMORIAL = math.prod(_SMALL_PRIMES)
+
+# Miller-Rabin with these witnesses is exact for n < 3.3*10^24 (OEIS A014233)
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def _miller_rabin(n, witnesses=_MR_WITNESSES):
+    """Miller-Rabin strong probable prime test for odd n > 41"""
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
 def is_prime_fast(n):
-    """Fast primality test"""
+    """Fast primality test - with gmpy2 a single BPSW test, no extra Miller-Rabin rounds"""
     if GMPY2_AVAILABLE:
-        return gmpy2.is_prime(n)
+        return n > 1 and gmpy2.is_bpsw_prp(n)
     else:
         if n < 2:
             return False
-        if n == 2:
+        if math.gcd(n, _SMALL_PRIMORIAL) != 1:
+            return n in _SMALL_PRIMES
+        if n < _SMALL_PRIMES[-1] ** 2:
             return True
-        if n % 2 == 0:
+        return _miller_rabin(n)
+
+if NUMBA_AVAILABLE:
+    _TRIAL_PRIMES = np.array([2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37], dtype=np.uint64)
+    # Sinclair's 7 bases make Miller-Rabin deterministic for every n < 2^64
+    _MR_BASES = np.array([2, 325, 9375, 28178, 450775, 9780504, 1795265022], dtype=np.uint64)
+    
+    @njit(cache=True)
+    def _mul_128(a, b):
+        """Full 64x64 -> 128 bit product as (hi, lo) built from 32-bit halves"""
+        mask = np.uint64(0xFFFFFFFF)
+        shift = np.uint64(32)
+        a_lo, a_hi = a & mask, a >> shift
+        b_lo, b_hi = b & mask, b >> shift
+        p0 = a_lo * b_lo
+        p1 = a_lo * b_hi
+        p2 = a_hi * b_lo
+        mid = (p0 >> shift) + (p1 & mask) + (p2 & mask)
+        lo = (p0 & mask) | (mid << shift)
+        hi = a_hi * b_hi + (p1 >> shift) + (p2 >> shift) + (mid >> shift)
+        return hi, lo
+    
+    @njit(cache=True)
+    def _mont_mul(a, b, n, n_neg_inv):
+        """Montgomery product a*b/R mod n with R = 2^64 (n odd, n < 2^63)"""
+        hi, lo = _mul_128(a, b)
+        q = lo * n_neg_inv
+        q_hi, q_lo = _mul_128(q, n)
+        # lo + q_lo is 0 mod 2^64 by construction, so it carries iff lo != 0
+        carry = np.uint64(1) if lo != np.uint64(0) else np.uint64(0)
+        r = hi + q_hi + carry
+        if r >= n:
+            r -= n
+        return r
+    
+    @njit(cache=True)
+    def _is_prime_u64(n):
+        """Deterministic Miller-Rabin for n < 2^63 (Sinclair bases)"""
+        if n < np.uint64(2):
             return False
-        for i in range(3, int(math.sqrt(n)) + 1, 2):
-            if n % i == 0:
+        for p in _TRIAL_PRIMES:
+            if n % p == np.uint64(0):
+                return n == p
+        if n < np.uint64(41 * 41):
+            return True
+        
+        # -n^-1 mod 2^64 by Newton iteration, then R mod n and R^2 mod n
+        inv = n
+        for _ in range(5):
+            inv *= np.uint64(2) - n * inv
+        n_neg_inv = np.uint64(0) - inv
+        one = (np.uint64(0) - n) % n
+        r2 = one
+        for _ in range(64):
+            r2 = r2 << np.uint64(1)
+            if r2 >= n:
+                r2 -= n
+        minus_one = n - one
+        
+        d = n - np.uint64(1)
+        s = 0
+        while d & np.uint64(1) == np.uint64(0):
+            d >>= np.uint64(1)
+            s += 1
+        
+        for b in _MR_BASES:
+            # A base that is 0 mod n says nothing - skip it
+            a = b % n
+            if a == np.uint64(0):
+                continue
+            
+            # x = a^d mod n, computed in Montgomery form
+            base = _mont_mul(a, r2, n, n_neg_inv)
+            x = one
+            e = d
+            while e > np.uint64(0):
+                if e & np.uint64(1):
+                    x = _mont_mul(x, base, n, n_neg_inv)
+                base = _mont_mul(base, base, n, n_neg_inv)
+                e >>= np.uint64(1)
+            
+            if x == one or x == minus_one:
+                continue
+            for _ in range(s - 1):
+                x = _mont_mul(x, x, n, n_neg_inv)
+                if x == minus_one:
+                    break
+            else:
                 return False
         return True
+    
+    @njit(parallel=True, cache=True)
+    def _scan_block(min_n, max_n, allowed_np):
+        """Test every wheel candidate in [min_n, max_n], one thread per position"""
+        npos = allowed_np.shape[0]
+        rounds = (max_n - min_n) // 69 + 1
+        found = np.zeros((npos, rounds), dtype=np.uint8)
+        
+        # First candidate >= min_n on every position at once, and how many follow
+        firsts = min_n + (allowed_np - min_n) % 69
+        counts = (max_n - firsts) // 69 + 1
+        
+        for i in prange(npos):
+            for k in range(counts[i]):
+                if _is_prime_u64(np.uint64(firsts[i] + 69 * k)):
+                    found[i, k] = 1
+        
+        # Every first candidate lies in [min_n, min_n + 69), so reading round by
+        # round in order of first candidate merges the sorted per-position runs
+        order = np.argsort(firsts)
+        
+        primes = np.empty(found.sum(), dtype=np.int64)
+        count = 0
+        for k in range(rounds):
+            for i in order:
+                if found[i, k]:
+                    primes[count] = firsts[i] + 69 * k
+                    count += 1
+        return primes
+    
+    def _scan(min_n, max_n, allowed_np, block_rounds=SCAN_BLOCK_ROUNDS):
+        """Scan [min_n, max_n] in blocks of block_rounds wheel turns, so the
+        flag matrix of _scan_block stays bounded however wide the range is"""
+        blocks = []
+        lo = min_n
+        while lo <= max_n:
+            hi = min(max_n, lo + 69 * block_rounds - 1)
+            blocks.append(_scan_block(lo, hi, allowed_np))
+            lo = hi + 1
+        if not blocks:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(blocks)
+
+def _base_primes(limit):
+    """Classical sieve for the base primes up to limit"""
+    base = bytearray([1]) * (limit + 1)
+    base[:2] = b'\x00\x00'
+    for i in range(2, math.isqrt(limit) + 1):
+        if base[i]:
+            base[i*i::i] = bytes(len(range(i*i, limit + 1, i)))
+    return list(itertools.compress(range(limit + 1), base))
+
+def segmented_sieve(min_n, max_n, seg_size=32768, allowed_positions=None):
+    """
+    Segmented Sieve of Eratosthenes - all primes in [min_n, max_n]
+    Each segment is seg_size bytes so it stays in L1 cache while composites
+    are crossed off. With numpy the segment is bit-packed (1 bit per odd number),
+    otherwise it is a bytearray crossed off with C-level slice assignment.
+    allowed_positions: optional dart-69 wheel positions to keep
+    """
+    min_n = max(min_n, 2)
+    if max_n < min_n:
+        return []
+    
+    base_primes = _base_primes(math.isqrt(max_n))
+    
+    if NUMPY_AVAILABLE:
+        primes = _bitpacked_segments(min_n, max_n, seg_size, base_primes, allowed_positions)
+    else:
+        primes = _bytearray_segments(min_n, max_n, seg_size, base_primes)
+        if allowed_positions is not None:
+            allowed_set = frozenset(allowed_positions)
+            primes = [p for p in primes if p % 69 in allowed_set]
+    
+    return primes
+
+def _bytearray_segments(min_n, max_n, seg_size, base_primes):
+    """Sieve [min_n, max_n] one bytearray segment at a time"""
+    primes = []
+    for lo in range(min_n, max_n + 1, seg_size):
+        hi = min(lo + seg_size, max_n + 1)
+        segment = bytearray([1]) * (hi - lo)
+        
+        for p in base_primes:
+            if p * p >= hi:
+                break
+            start = max(p * p, ((lo + p - 1) // p) * p)
+            segment[start - lo::p] = bytes(len(range(start, hi, p)))
+        
+        primes.extend(itertools.compress(range(lo, hi), segment))
+    
+    return primes
+
+def _bitpacked_segments(min_n, max_n, seg_size, base_primes, allowed_positions):
+    """
+    Sieve the odd numbers of [min_n, max_n] with 1 bit per odd number
+    Bit j of a segment starting at odd lo stands for lo + 2*j (set = composite)
+    """
+    # Odd number 2*m+1 sits on wheel position (2*m+1) % 69, which depends only on m % 69
+    if allowed_positions is not None:
+        allowed_set = frozenset(allowed_positions)
+        odd_allowed = np.array([(2 * m + 1) % 69 in allowed_set for m in range(69)])
+    
+    primes = []
+    if min_n <= 2 and (allowed_positions is None or 2 in allowed_set):
+        primes.append(2)
+    
+    seg_bits = seg_size * 8
+    odd_base_primes = base_primes[1:]
+    lo = min_n | 1
+    
+    while lo <= max_n:
+        nbits = min(seg_bits, (max_n - lo) // 2 + 1)
+        hi = lo + 2 * nbits
+        segment = np.zeros((nbits + 7) // 8, dtype=np.uint8)
+        
+        for p in odd_base_primes:
+            if p * p >= hi:
+                break
+            start = max(p * p, ((lo + p - 1) // p) * p)
+            if start % 2 == 0:
+                start += p
+            
+            # Odd multiples are p bits apart, so bits j, j+8p, ... share a bit
+            # offset and lie p bytes apart - one strided OR per residue of j % 8
+            j = (start - lo) // 2
+            for _ in range(8):
+                if j >= nbits:
+                    break
+                segment[j >> 3::p] |= np.uint8(1 << (j & 7))
+                j += p
+        
+        composite = np.unpackbits(segment, count=nbits, bitorder='little')
+        idx = np.flatnonzero(composite == 0)
+        if allowed_positions is not None:
+            idx = idx[odd_allowed[(lo // 2 + idx) % 69]]
+        primes.extend((lo + 2 * idx).tolist())
+        
+        lo = hi
+    
+    return primes
 
 def generate_allowed_positions():
     """Generate the 46 allowed positions in the 69-wheel"""
@@ -62,6 +361,26 @@ def generate_allowed_positions():
     
     return allowed
 
+def _wheel_steps(positions):
+    """Gaps between consecutive allowed positions, wrapping around the 69-wheel"""
+    wrapped = positions[1:] + (positions[0] + 69,)
+    return tuple(nxt - pos for pos, nxt in zip(positions, wrapped))
+
+# Precomputed dart-69 wheel tables - built once at import
+ALLOWED_POSITIONS = tuple(generate_allowed_positions())
+HIGH_DIM_POSITIONS = tuple(pos for pos in ALLOWED_POSITIONS if pos not in (3, 23))
+WHEEL_69 = bytes(1 if pos in ALLOWED_POSITIONS else 0 for pos in range(69))
+DART69_ALLOWED_MASK = sum(1 << pos for pos in ALLOWED_POSITIONS)
+WHEEL_STEPS = _wheel_steps(ALLOWED_POSITIONS)
+HIGH_DIM_WHEEL_STEPS = _wheel_steps(HIGH_DIM_POSITIONS)
+
+# Repeating presieve bitmap for 7, 11, 13, 17 - index by n % PRESIEVE_MOD (0 = composite)
+PRESIEVE_MOD = 7 * 11 * 13 * 17
+PRESIEVE = bytearray([1]) * PRESIEVE_MOD
+for _p in (7, 11, 13, 17):
+    PRESIEVE[::_p] = bytes(len(range(0, PRESIEVE_MOD, _p)))
+    PRESIEVE[_p] = 1  # keep the presieve primes themselves
+
 def generate_primes_by_formula(dimension, include_exceptions=True):
     """
     Generate primes using dart-69 formula instead of brute force checking
@@ -78,13 +397,11 @@ def generate_primes_by_formula(dimension, include_exceptions=True):
     print(f"Dimension {dimension} range: [{min_n:,}, {max_n:,}]")
     print(f"Total numbers in range: {total_range:,}")
     
-    # Get allowed positions
-    allowed_positions = generate_allowed_positions()
-    
-    # Modify allowed positions based on dimension
+    # Get allowed positions - exceptions 3 and 23 are removed for higher dimensions
     if not include_exceptions or dimension > 3:
-        # Remove exceptions 3 and 23 for higher dimensions
-        allowed_positions = [pos for pos in allowed_positions if pos not in [3, 23]]
+        allowed_positions, wheel_steps = HIGH_DIM_POSITIONS, HIGH_DIM_WHEEL_STEPS
+    else:
+        allowed_positions, wheel_steps = ALLOWED_POSITIONS, WHEEL_STEPS
     
     print(f"Allowed wheel positions: {len(allowed_positions)} out of 69")
     print(f"Theoretical candidates: ~{total_range * len(allowed_positions) // 69:,}")
@@ -94,23 +411,49 @@ def generate_primes_by_formula(dimension, include_exceptions=True):
     candidates_tested = 0
     primes_found = []
     
-    print("Generating prime candidates using dart-69 formula...")
-    
-    # For each allowed position, find all numbers in dimension range with that position
-    for pos in allowed_positions:
-        position_primes = []
+    if max_n <= SIEVE_LIMIT:
+        print("Sieving dimension range with segmented Sieve of Eratosthenes...")
         
-        # Find first number >= min_n with this position
-        start_num = min_n
-        remainder = start_num % 69
+        # Sieve the whole range, keeping only primes on allowed wheel positions
+        # (already sorted - segments are emitted in increasing order)
+        primes_found = segmented_sieve(min_n, max_n, allowed_positions=allowed_positions)
+    elif NUMBA_AVAILABLE and max_n < MONTGOMERY_LIMIT:
+        print("Scanning dart-69 candidates with compiled Miller-Rabin...")
         
-        if remainder <= pos:
-            first_candidate = start_num + (pos - remainder)
-        else:
-            first_candidate = start_num + (69 - remainder + pos)
+        primes_found = _scan(min_n, max_n, np.array(allowed_positions, dtype=np.int64)).tolist()
+    elif GMPY2_AVAILABLE:
+        print("Jumping between primes with gmpy2.next_prime...")
+        
+        # Primes are ~ln(n) apart out here, so let GMP find each next prime
+        # in C and only check its wheel position in Python
+        allowed_mask = sum(1 << pos for pos in allowed_positions)
+        prime = gmpy2.next_prime(min_n - 1)
+        while prime <= max_n:
+            if allowed_mask >> (prime % 69) & 1:
+                primes_found.append(int(prime))
+                
+                # Progress indicator
+                if len(primes_found) % 10000 == 0:
+                    elapsed = time.time() - start_time
+                    print(f"  Found {len(primes_found):,} primes, reached {int(prime):,} ({elapsed:.1f}s)")
+            
+            prime = gmpy2.next_prime(prime)
+    else:
+        print("Generating prime candidates using dart-69 formula...")
+        
+        # Find the first candidate >= min_n on an allowed wheel position
+        step_idx = bisect.bisect_left(allowed_positions, min_n % 69)
+        candidate = min_n - min_n % 69
+        if step_idx == len(allowed_positions):
+            step_idx = 0
+            candidate += 69
+        candidate += allowed_positions[step_idx]
         
-        # Generate all candidates with this position in the range
-        candidate = first_candidate
+        # Bind the hot lookups locally and cycle the steps instead of indexing them
+        steps = itertools.cycle(wheel_steps[step_idx:] + wheel_steps[:step_idx])
+        presieve = PRESIEVE
+        
+        # Walk the wheel: each step jumps straight to the next allowed position
         while candidate <= max_n:
             candidates_tested += 1
             
@@ -119,20 +462,27 @@ def generate_primes_by_formula(dimension, include_exceptions=True):
                 elapsed = time.time() - start_time
                 print(f"  Tested {candidates_tested:,} candidates, found {len(primes_found):,} primes ({elapsed:.1f}s)")
             
-            if is_prime_fast(candidate):
+            # Presieve lookup first - skips ~30% of candidates without a primality test
+            if presieve[candidate % PRESIEVE_MOD] and is_prime_fast(candidate):
                 primes_found.append(candidate)
-                position_primes.append(candidate)
             
-            candidate += 69  # Next number with same wheel position
-        
-        # Show progress for this position
-        if position_primes:
-            print(f"  Position {pos:2}: {len(position_primes):2} primes")
+            candidate += next(steps)
     
-    elapsed_time = time.time() - start_time
+    if not candidates_tested:
+        # Count wheel candidates per position without walking them
+        for pos in allowed_positions:
+            first = min_n + (pos - min_n) % 69
+            candidates_tested += max(0, (max_n - first) // 69 + 1)
     
-    # Sort primes
-    primes_found.sort()
+    # Show results per position
+    position_counts = {}
+    for p in primes_found:
+        position_counts[p % 69] = position_counts.get(p % 69, 0) + 1
+    for pos in allowed_positions:
+        if pos in position_counts:
+            print(f"  Position {pos:2}: {position_counts[pos]:2} primes")
+    
+    elapsed_time = time.time() - start_time
     
     print(f"\n✓ Generation complete in {elapsed_time:.2f} seconds")
     print(f"Candidates tested: {candidates_tested:,}")
@@ -177,13 +527,14 @@ def compare_methods(dimension):
         print(f"Brute force method: {len(brute_force_primes):,} primes in {brute_force_time:.2f}s")
         print(f"Speed improvement: {brute_force_time/formula_time:.1f}x faster")
         
-        # Verify they found the same primes
-        if set(formula_primes) == set(brute_force_primes):
+        # Verify they found the same primes (both lists come out sorted)
+        if formula_primes == brute_force_primes:
             print("✓ IDENTICAL RESULTS - Formula method is correct!")
         else:
             print("⚠ Different results - checking discrepancies...")
-            only_formula = set(formula_primes) - set(brute_force_primes)
-            only_brute = set(brute_force_primes) - set(formula_primes)
+            formula_set, brute_set = set(formula_primes), set(brute_force_primes)
+            only_formula = formula_set - brute_set
+            only_brute = brute_set - formula_set
             if only_formula:
                 print(f"  Only in formula: {only_formula}")
             if only_brute:
@@ -195,29 +546,82 @@ def compare_methods(dimension):
     
     return formula_primes
 
-def batch_generate(start_dim, end_dim):
-    """Generate primes for multiple dimensions quickly"""
+def _init_batch_worker(numba_threads):
+    """Pool initializer - split the cores between the workers' parallel _scan kernels"""
+    if NUMBA_AVAILABLE:
+        set_num_threads(numba_threads)
+
+def _generate_dimension(d):
+    """Worker for batch_generate - returns (prime count, seconds, captured output)"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        start_time = time.time()
+        primes = generate_primes_by_formula(d, include_exceptions=(d <= 3))
+        elapsed = time.time() - start_time
+    
+    return len(primes), elapsed, output.getvalue()
+
+def batch_generate(start_dim, end_dim, workers=None):
+    """
+    Generate primes for multiple dimensions quickly
+    Dimensions are independent, so they run in separate processes (gmpy2 and
+    the pure Python tests hold the GIL). Each worker's report is printed in
+    dimension order once it finishes.
+    Workers are spawned, not forked - a fork after numba's parallel _scan has
+    run can deadlock on its thread pool's locks - and share the cores between
+    their _scan threads instead of each starting one per core.
+    """
     print(f"🎯 BATCH DART-69 GENERATION: Dimensions {start_dim} to {end_dim}")
     print("=" * 70)
     
+    dimensions = range(start_dim, end_dim + 1)
+    workers = min(workers or os.cpu_count() or 1, len(dimensions))
+    
     total_primes = 0
-    total_time = 0
+    batch_start = time.time()
     
-    for d in range(start_dim, end_dim + 1):
-        start_time = time.time()
-        primes = generate_primes_by_formula(d, include_exceptions=(d <= 3))
-        elapsed = time.time() - start_time
-        
-        total_primes += len(primes)
-        total_time += elapsed
-        
-        print(f"Dimension {d:2}: {len(primes):,} primes ({elapsed:.2f}s)")
+    if workers > 1:
+        numba_threads = max(1, get_num_threads() // workers) if NUMBA_AVAILABLE else 1
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_batch_worker,
+            initargs=(numba_threads,),
+        )
+        results = pool.map(_generate_dimension, dimensions)
+    else:
+        pool = None
+        results = map(_generate_dimension, dimensions)
+    
+    try:
+        for d, (count, elapsed, output) in zip(dimensions, results):
+            print(output, end="")
+            total_primes += count
+            print(f"Dimension {d:2}: {count:,} primes ({elapsed:.2f}s)")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    
+    total_time = time.time() - batch_start
     
     print(f"\nBATCH SUMMARY:")
     print(f"Total primes generated: {total_primes:,}")
     print(f"Total time: {total_time:.2f}s")
     print(f"Average: {total_primes/total_time:.0f} primes/second")
 
+def format_rows(primes, width, per_row=8):
+    """
+    Primes as right-aligned, comma-grouped rows of per_row, joined by newlines
+    The whole layout is one format string, so all numbers are formatted in a
+    single str.format call instead of one f-string per prime.
+    """
+    full_rows, rest = divmod(len(primes), per_row)
+    cell = f"{{:>{width},}}"
+    lines = [" ".join([cell] * per_row)] * full_rows
+    if rest:
+        lines.append(" ".join([cell] * rest))
+    return "\n".join(lines).format(*primes)
+
 def interactive_generator():
     """Interactive prime generation tool"""
     print("🎯 DART-69 FORMULA-BASED PRIME GENERATOR")
@@ -267,9 +671,8 @@ def interactive_generator():
             print("-" * 60)
             
             # Print in rows of 8 for readability
-            for i in range(0, len(primes), 8):
-                row = primes[i:i+8]
-                print(" ".join(f"{p:>8,}" for p in row))
+            if primes:
+                print(format_rows(primes, 8))
             
             # Save option
             save = input(f"\nSave {len(primes):,} primes to file? (y/n): ").strip().lower()
@@ -279,12 +682,9 @@ def interactive_generator():
                     f.write(f"DART-69 Dimension {dimension} Primes (Formula Generated)\n")
                     f.write(f"Total: {len(primes):,} primes\n\n")
                     
-                    for i, prime in enumerate(primes):
-                        f.write(f"{prime:>10,}")
-                        if (i + 1) % 8 == 0:
-                            f.write("\n")
-                        else:
-                            f.write(" ")
+                    # Build the rows in memory and write them in one call
+                    if primes:
+                        f.write(format_rows(primes, 10) + ("\n" if len(primes) % 8 == 0 else " "))
                 
                 print(f"Saved to {filename}")
             
@@ -21,16 +21,24 @@ except ImportError:
     print("  Falling back to standard library (limited to smaller numbers)")
     GMPY2_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+import bisect
+import concurrent.futures
+import functools
 import math
+import os
+import secrets
 import time
-from decimal import Decimal, getcontext
-
-# Set high precision for π calculations
-getcontext().prec = 50
 
 # Pre-computed lookup tables for maximum speed
 INVALID_LAST_DIGITS = {0, 2, 4, 5, 6, 8}  # Numbers ending in these can't be prime (except 2, 5)
 VALID_LAST_DIGITS = {1, 3, 7, 9}  # Only these endings can be prime for n > 5
+INVALID_DIGIT_MASK = sum(1 << d for d in INVALID_LAST_DIGITS)  # 0b101110101 - test with (mask >> digit) & 1
 
 # DART-69 forbidden positions (multiples of 3 OR multiples of 23)
 DART69_FORBIDDEN = set()
@@ -39,36 +47,88 @@ for i in range(69):
         DART69_FORBIDDEN.add(i)
 
 DART69_ALLOWED = set(range(69)) - DART69_FORBIDDEN
+
+# 69-bit masks - a shift and AND instead of a set lookup per check
+DART69_FORBIDDEN_MASK = sum(1 << i for i in DART69_FORBIDDEN)
+DART69_ALLOWED_MASK = sum(1 << i for i in DART69_ALLOWED)
 print(f"✓ DART-69 initialized: {len(DART69_FORBIDDEN)}/69 positions forbidden ({len(DART69_FORBIDDEN)/69*100:.1f}%)")
 
+# Small primes below 256 - one gcd with their product rejects most composites
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67,
+                 71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139, 149,
+                 151, 157, 163, 167, 173, 179, 181, 191, 193, 197, 199, 211, 223, 227, 229,
+                 233, 239, 241, 251)
+_SMALL_PRIMORIAL = math.prod(_SMALL_PRIMES)
+
+# Miller-Rabin with these witnesses is exact for n < 3.3*10^24 (OEIS A014233)
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def _miller_rabin(n, witnesses=_MR_WITNESSES):
+    """Miller-Rabin strong probable prime test for odd n > 41"""
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
 def is_prime_fast(n):
-    """Fast primality test using gmpy2 if available"""
+    """
+    Fast primality test using gmpy2 if available
+    With gmpy2 this is a single BPSW test (no known counterexample) instead of
+    is_prime's extra Miller-Rabin rounds - is_prime_strict keeps those.
+    """
     if GMPY2_AVAILABLE:
-        return gmpy2_is_prime(int(n)) != 0
+        n = int(n)
+        return n > 1 and gmpy2.is_bpsw_prp(n)
     else:
         n = int(n)
         if n < 2:
             return False
-        if n == 2:
+        if math.gcd(n, _SMALL_PRIMORIAL) != 1:
+            return n in _SMALL_PRIMES
+        if n < _SMALL_PRIMES[-1] ** 2:
             return True
-        if n % 2 == 0:
-            return False
-        
-        sqrt_n = int(math.sqrt(n))
-        for i in range(3, sqrt_n + 1, 2):
-            if n % i == 0:
-                return False
-        return True
+        return _miller_rabin(n)
+
+def is_prime_strict(n):
+    """Primality test with gmpy2's full is_prime rounds - for results shown to the user"""
+    if GMPY2_AVAILABLE:
+        return gmpy2_is_prime(int(n)) != 0
+    return is_prime_fast(n)
+
+# π as a float, converted from gmpy2 once instead of on every call
+_PI_FLOAT = float(gmpy2.const_pi()) if GMPY2_AVAILABLE else math.pi
+
+# Upper bounds floor(π^d) for dimensions 1-100, computed once
+_PI_BOUNDS = [math.floor(_PI_FLOAT ** d) for d in range(1, 101)]
+
+# Start of each dimension indexed by d (d=0 covers n <= 1, d=101 is the safety cap)
+_DIMENSION_STARTS = [1, 2] + [bound + 1 for bound in _PI_BOUNDS]
+
+if NUMPY_AVAILABLE:
+    # int64 versions of the lookup tables for vectorized batch prefiltering
+    _PI_BOUNDS_I64 = np.array([b for b in _PI_BOUNDS if b < 2**63], dtype=np.int64)
+    _DIMENSION_STARTS_I64 = np.array(_DIMENSION_STARTS[:len(_PI_BOUNDS_I64) + 2], dtype=np.int64)
+    _INVALID_DIGIT_LUT = np.array([d in INVALID_LAST_DIGITS for d in range(10)])
+    _FORBIDDEN_LUT = np.array([i in DART69_FORBIDDEN for i in range(69)])
 
+@functools.lru_cache(maxsize=128)
 def get_dimension_range(dimension):
     """Calculate π-dimensional bounds."""
-    if GMPY2_AVAILABLE:
-        pi = float(gmpy2.const_pi())
-    else:
-        pi = math.pi
-    
-    start = math.floor(pi ** (dimension - 1)) + 1
-    end = math.floor(pi ** dimension)
+    start = math.floor(_PI_FLOAT ** (dimension - 1)) + 1
+    end = math.floor(_PI_FLOAT ** dimension)
     return start, end
 
 def get_dimension_for_number(n):
@@ -76,34 +136,22 @@ def get_dimension_for_number(n):
     if n <= 1:
         return 0
     
-    # Use high precision π for large numbers
-    if GMPY2_AVAILABLE:
-        pi = float(gmpy2.const_pi())
-    else:
-        pi = math.pi
-    
     # Find dimension d where floor(π^(d-1)) < n <= floor(π^d)
-    d = 1
-    while True:
-        upper_bound = math.floor(pi ** d)
-        if n <= upper_bound:
-            return d
-        d += 1
-        if d > 100:  # Safety check
-            return d
-
-def get_dart69_position(n):
+    # (101 past the last precomputed bound, as a safety cap)
+    return bisect.bisect_left(_PI_BOUNDS, n) + 1
+
+def get_dart69_position(n, dimension=None):
     """Get the dart-69 wheel position for number n (dimensional method)"""
-    dimension = get_dimension_for_number(n)
-    start, end = get_dimension_range(dimension)
+    n = int(n)
+    if dimension is None:
+        dimension = get_dimension_for_number(n)
     
     # Position relative to dimension start
-    relative_position = int(n) - start
-    return relative_position % 69
+    return (n - _DIMENSION_STARTS[dimension]) % 69
 
-def get_dart69_angle(n):
+def get_dart69_angle(n, dimension=None):
     """Calculate the dart-69 angle in degrees (dimensional method)"""
-    position = get_dart69_position(n)
+    position = get_dart69_position(n, dimension)
     return position * (360 / 69)
 
 def last_digit_precheck(n):
@@ -121,44 +169,54 @@ def last_digit_precheck(n):
         return True, "Special case: 5"
     
     # Check invalid endings
-    if last_digit in INVALID_LAST_DIGITS:
+    if (INVALID_DIGIT_MASK >> last_digit) & 1:
         return False, f"Invalid last digit: {last_digit}"
     
     return True, f"Valid last digit: {last_digit}"
 
-def dart69_precheck(n):
+def dart69_precheck(n, dimension=None):
     """
     Use dart-69 system to check forbidden zones (dimensional method)
     Forbidden zones: multiples of 3 OR multiples of 23
+    dimension: π-dimension of n, if the caller already knows it
     Returns: (could_be_prime, reason, position, angle)
     """
-    n_int = int(n)
+    n_int = n if isinstance(n, int) else int(n)
+    if dimension is None:
+        dimension = get_dimension_for_number(n_int)
     
     # Get dart-69 position and angle using dimensional method
-    position = get_dart69_position(n_int)
-    angle = get_dart69_angle(n_int)
-    dimension = get_dimension_for_number(n_int)
+    position = get_dart69_position(n_int, dimension)
+    angle = position * (360 / 69)
     
     # Check forbidden zones (multiples of 3 OR multiples of 23)
-    if position in DART69_FORBIDDEN:
-        if position % 3 == 0 and position % 23 == 0:
-            return False, f"Forbidden zone (pos {position}, multiple of both 3 and 23)", position, angle
-        elif position % 3 == 0:
-            return False, f"Forbidden zone (pos {position}, multiple of 3)", position, angle
-        else:  # position % 23 == 0
-            return False, f"Forbidden zone (pos {position}, multiple of 23)", position, angle
+    if (DART69_FORBIDDEN_MASK >> position) & 1:
+        return False, forbidden_zone_reason(position), position, angle
     
     # Passed dart-69 precheck
     return True, f"Allowed position {position} in D{dimension}", position, angle
 
-def optimized_prime_check(n, verbose=False):
+def forbidden_zone_reason(position):
+    """Explain why a forbidden dart-69 position was rejected"""
+    if position % 3 == 0 and position % 23 == 0:
+        return f"Forbidden zone (pos {position}, multiple of both 3 and 23)"
+    elif position % 3 == 0:
+        return f"Forbidden zone (pos {position}, multiple of 3)"
+    else:  # position % 23 == 0
+        return f"Forbidden zone (pos {position}, multiple of 23)"
+
+def optimized_prime_check(n, verbose=False, collect_timings=False):
     """
     Multi-stage optimized prime check with DART-69 priority
+    Stage timings are only measured when verbose or collect_timings is set
     Returns: (is_prime, stage_passed, details)
     """
-    start_time = time.time()
+    timed = verbose or collect_timings
+    if timed:
+        start_time = time.time()
     n_str = str(n)
     n_int = int(n)
+    dimension = get_dimension_for_number(n_int)
     
     # Stage timings
     stage_times = {}
@@ -169,29 +227,35 @@ def optimized_prime_check(n, verbose=False):
         print(f"{'='*80}")
         print(f"Number: {n_str}")
         print(f"Digits: {len(n_str):,}")
-        print(f"π-Dimension: {get_dimension_for_number(n_int)}")
+        print(f"π-Dimension: {dimension}")
         print()
     
     # STAGE 1: Special cases
-    stage1_start = time.time()
+    if timed:
+        stage1_start = time.time()
     if n_int < 2:
-        stage_times['stage1'] = time.time() - stage1_start
+        if timed:
+            stage_times['stage1'] = time.time() - stage1_start
         if verbose:
             print("🚫 STAGE 1: Less than 2")
         return False, 1, {"reason": "Less than 2", "times": stage_times}
     
     if n_int in {2, 3, 5, 7}:
-        stage_times['stage1'] = time.time() - stage1_start
+        if timed:
+            stage_times['stage1'] = time.time() - stage1_start
         if verbose:
             print(f"🎯 STAGE 1: Special prime case ({n_int})")
         return True, 1, {"reason": f"Special prime: {n_int}", "times": stage_times}
     
-    stage_times['stage1'] = time.time() - stage1_start
+    if timed:
+        stage_times['stage1'] = time.time() - stage1_start
     
     # STAGE 2: Last digit filter
-    stage2_start = time.time()
+    if timed:
+        stage2_start = time.time()
     last_digit_ok, last_digit_reason = last_digit_precheck(n_int)
-    stage_times['stage2'] = time.time() - stage2_start
+    if timed:
+        stage_times['stage2'] = time.time() - stage2_start
     
     if not last_digit_ok:
         if verbose:
@@ -202,9 +266,11 @@ def optimized_prime_check(n, verbose=False):
         print(f"✓ STAGE 2: {last_digit_reason}")
     
     # STAGE 3: DART-69 forbidden zones (moved up for efficiency)
-    stage3_start = time.time()
-    dart69_ok, dart69_reason, position, angle = dart69_precheck(n_int)
-    stage_times['stage3'] = time.time() - stage3_start
+    if timed:
+        stage3_start = time.time()
+    dart69_ok, dart69_reason, position, angle = dart69_precheck(n_int, dimension)
+    if timed:
+        stage_times['stage3'] = time.time() - stage3_start
     
     if not dart69_ok:
         if verbose:
@@ -221,10 +287,12 @@ def optimized_prime_check(n, verbose=False):
         print("\n🔍 Passed all pre-filters - proceeding to full primality test...")
     
     # STAGE 4: Full primality test
-    stage4_start = time.time()
-    is_prime_result = is_prime_fast(n_int)
-    stage_times['stage4'] = time.time() - stage4_start
-    stage_times['total'] = time.time() - start_time
+    if timed:
+        stage4_start = time.time()
+    is_prime_result = is_prime_strict(n_int) if verbose else is_prime_fast(n_int)
+    if timed:
+        stage_times['stage4'] = time.time() - stage4_start
+        stage_times['total'] = time.time() - start_time
     
     if verbose:
         result_icon = "🎯" if is_prime_result else "🚫"
@@ -282,7 +350,7 @@ def find_nearby_primes(n, count=5):
         position = get_dart69_position(candidate)
         
         # Only include if NOT in forbidden zone
-        if position not in DART69_FORBIDDEN:
+        if (DART69_ALLOWED_MASK >> position) & 1:
             found_primes.append(candidate)
         
         current = gmpy2.mpz(candidate)
@@ -297,7 +365,7 @@ def find_nearby_primes(n, count=5):
     
     for prime in found_primes:
         pos = get_dart69_position(prime)
-        angle = get_dart69_angle(prime)
+        angle = pos * (360 / 69)
         distance = abs(prime - int(n))
         direction = "+" if prime > int(n) else ""
         
@@ -305,8 +373,91 @@ def find_nearby_primes(n, count=5):
     
     return found_primes
 
-def batch_analysis(numbers, show_stats=True):
-    """Analyze filtering efficiency across multiple numbers"""
+def batch_prefilter(numbers):
+    """
+    Run stages 1-3 for a whole batch as numpy passes
+    Returns: (stages, positions, stage_times), or None if numpy is missing or
+    a number does not fit in int64 (stage 4 = passed all pre-filters)
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+    try:
+        arr = np.asarray(numbers, dtype=np.int64)
+    except OverflowError:
+        return None
+    
+    stage_times = {}
+    stages = np.full(len(arr), 4, dtype=np.int8)
+    
+    # STAGE 1: Special cases
+    stage1_start = time.time()
+    special = (arr < 2) | np.isin(arr, (2, 3, 5, 7))
+    stages[special] = 1
+    stage_times['stage1'] = time.time() - stage1_start
+    
+    # STAGE 2: Last digit filter
+    stage2_start = time.time()
+    stages[_INVALID_DIGIT_LUT[arr % 10] & (stages == 4)] = 2
+    stage_times['stage2'] = time.time() - stage2_start
+    
+    # STAGE 3: DART-69 forbidden zones (position relative to dimension start)
+    stage3_start = time.time()
+    dimensions = np.searchsorted(_PI_BOUNDS_I64, np.maximum(arr, 2)) + 1
+    positions = (arr - _DIMENSION_STARTS_I64[dimensions]) % 69
+    stages[_FORBIDDEN_LUT[positions] & (stages == 4)] = 3
+    stage_times['stage3'] = time.time() - stage3_start
+    
+    return stages, positions, stage_times
+
+def prefiltered_prime_check(n, stage, position, collect_timings=False):
+    """
+    Finish a check for a number already classified by batch_prefilter
+    Returns: (is_prime, stage_passed, details) like optimized_prime_check
+    """
+    n_int = int(n)
+    
+    if stage == 1:
+        if n_int < 2:
+            return False, 1, {"reason": "Less than 2", "times": {}}
+        return True, 1, {"reason": f"Special prime: {n_int}", "times": {}}
+    
+    if stage == 2:
+        return False, 2, {"reason": last_digit_precheck(n_int)[1], "times": {}}
+    
+    angle = position * (360 / 69)
+    if stage == 3:
+        return False, 3, {
+            "reason": forbidden_zone_reason(position),
+            "position": position,
+            "angle": angle,
+            "times": {}
+        }
+    
+    if not collect_timings:
+        is_prime_result = is_prime_fast(n_int)
+        times = {}
+    else:
+        stage4_start = time.time()
+        is_prime_result = is_prime_fast(n_int)
+        stage4_time = time.time() - stage4_start
+        times = {'stage4': stage4_time, 'total': stage4_time}
+    
+    return is_prime_result, 4, {
+        "reason": f"{'Prime' if is_prime_result else 'Composite'} at position {position}",
+        "position": position,
+        "angle": angle,
+        "times": times
+    }
+
+# Below this many numbers per worker, process start-up costs more than it saves
+_MIN_NUMBERS_PER_WORKER = 256
+
+def batch_analysis(numbers, show_stats=True, workers=None):
+    """
+    Analyze filtering efficiency across multiple numbers
+    The checks are independent, so large batches are spread over worker
+    processes; results are printed in input order.
+    """
     print(f"🎯 BATCH ANALYSIS - {len(numbers)} numbers")
     print("=" * 70)
     
@@ -316,23 +467,49 @@ def batch_analysis(numbers, show_stats=True):
     
     results = []
     
-    for i, n in enumerate(numbers):
-        print(f"[{i+1:>3}/{len(numbers)}] {n:>15,}", end=" -> ")
-        
-        is_prime_result, stage, details = optimized_prime_check(n, verbose=False)
-        stage_counts[stage] += 1
-        
-        # Accumulate timing
-        if 'times' in details:
-            for key, value in details['times'].items():
-                if key in total_times:
-                    total_times[key] += value
-        
-        status = "🎯 PRIME" if is_prime_result else "🚫 COMPOSITE"
-        stage_name = ["", "special", "last digit", "DART-69", "full test"][stage]
-        print(f"{status} (filtered at: {stage_name})")
-        
-        results.append((n, is_prime_result, stage, details))
+    # Stages 1-3 for the whole batch at once when the numbers fit in int64
+    prefilter = batch_prefilter(numbers)
+    if prefilter is not None:
+        stages, positions, stage_times = prefilter
+        for key, value in stage_times.items():
+            total_times[key] += value
+            total_times['total'] += value
+    
+    if prefilter is None:
+        check = functools.partial(optimized_prime_check, verbose=False, collect_timings=show_stats)
+        args = (numbers,)
+    else:
+        check = functools.partial(prefiltered_prime_check, collect_timings=show_stats)
+        args = (numbers, stages.tolist(), positions.tolist())
+    
+    workers = min(workers or os.cpu_count() or 1, len(numbers) // _MIN_NUMBERS_PER_WORKER)
+    
+    if workers > 1:
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        checked = pool.map(check, *args, chunksize=max(1, len(numbers) // (8 * workers)))
+    else:
+        pool = None
+        checked = map(check, *args)
+    
+    try:
+        for i, (n, (is_prime_result, stage, details)) in enumerate(zip(numbers, checked)):
+            print(f"[{i+1:>3}/{len(numbers)}] {n:>15,}", end=" -> ")
+            stage_counts[stage] += 1
+            
+            # Accumulate timing
+            if 'times' in details:
+                for key, value in details['times'].items():
+                    if key in total_times:
+                        total_times[key] += value
+            
+            status = "🎯 PRIME" if is_prime_result else "🚫 COMPOSITE"
+            stage_name = ["", "special", "last digit", "DART-69", "full test"][stage]
+            print(f"{status} (filtered at: {stage_name})")
+            
+            results.append((n, is_prime_result, stage, details))
+    finally:
+        if pool is not None:
+            pool.shutdown()
     
     if show_stats:
         print(f"\n{'='*70}")
@@ -407,17 +584,14 @@ def interactive_checker():
                         print("Please enter a reasonable number of digits (1-1000)")
                         continue
                     
-                    import random
                     if digits == 1:
-                        number = random.randint(2, 9)  # Start from 2 for single digits
+                        number = 2 + secrets.randbelow(8)  # Start from 2 for single digits
                     else:
-                        first_digit = random.randint(1, 9)
-                        remaining = ''.join(str(random.randint(0, 9)) for _ in range(digits - 1))
+                        lowest = 10 ** (digits - 1)
+                        number = lowest + secrets.randbelow(9 * lowest)
                         # Ensure it ends in a valid digit for efficiency demonstration
-                        if random.random() < 0.3:  # 30% chance to make it end in valid digit
-                            last_valid = random.choice([1, 3, 7, 9])
-                            remaining = remaining[:-1] + str(last_valid)
-                        number = int(str(first_digit) + remaining)
+                        if secrets.randbelow(10) < 3:  # 30% chance to make it end in valid digit
+                            number = number - number % 10 + secrets.choice((1, 3, 7, 9))
                     
                     print(f"\nRandom {digits}-digit number: {number}")
                     optimized_prime_check(number, verbose=True)
@@ -18,31 +18,66 @@ except ImportError:
     print("  Falling back to standard library (limited to smaller numbers)")
     GMPY2_AVAILABLE = False
 
+import bisect
+import concurrent.futures
 import math
+import os
+import secrets
 import time
-from decimal import Decimal, getcontext
 
-# Set high precision for π calculations
-getcontext().prec = 50
+# Primes below 1000 - trial division by all of them is a single gcd with their product
+_SMALL_PRIMES = tuple(p for p in range(2, 1000) if all(p % q for q in range(2, math.isqrt(p) + 1)))
+_SMALL_PRIMORIAL = math.prod(_SMALL_PRIMES)
+
+# Sinclair's 7 bases make Miller-Rabin deterministic for every n < 2^64
+_MR_WITNESSES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+# Past 2^64: exact below 3.3*10^24 (OEIS A014233), a strong probable prime test above
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def _miller_rabin(n, witnesses):
+    """Miller-Rabin strong probable prime test for odd n > 2"""
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in witnesses:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+# GMP trial-divides small operands itself - the primorial gcd only pays off above this size
+_GCD_PRECHECK_BITS = 256
 
 def is_prime_fast(n):
     """Fast primality test using gmpy2 if available"""
     if GMPY2_AVAILABLE:
-        return gmpy2_is_prime(int(n)) != 0
+        n = int(n)
+        if n.bit_length() > _GCD_PRECHECK_BITS and gmpy2.gcd(n, _SMALL_PRIMORIAL) != 1:
+            return False
+        return gmpy2_is_prime(n) != 0
     else:
         n = int(n)
         if n < 2:
             return False
-        if n == 2:
+        if math.gcd(n, _SMALL_PRIMORIAL) != 1:
+            return n in _SMALL_PRIMES
+        if n < _SMALL_PRIMES[-1] ** 2:
             return True
-        if n % 2 == 0:
-            return False
         
-        sqrt_n = int(math.sqrt(n))
-        for i in range(3, sqrt_n + 1, 2):
-            if n % i == 0:
-                return False
-        return True
+        return _miller_rabin(n, _MR_WITNESSES_64 if n < 2**64 else _MR_WITNESSES)
 
 def get_dart69_position(n):
     """Get the dart-69 wheel position for number n"""
@@ -53,72 +88,87 @@ def get_dart69_angle(n):
     position = get_dart69_position(n)
     return position * (360 / 69)
 
+# Forbidden wheel positions as 69-bit masks - bit pos set = forbidden (every 3rd position),
+# the early-dimension mask lets positions 3 and 23 through
+FORBIDDEN_MASK = sum(1 << pos for pos in range(69) if pos % 3 == 0)
+FORBIDDEN_MASK_EARLY = FORBIDDEN_MASK & ~((1 << 3) | (1 << 23))
+
 def is_forbidden_position(pos, allow_early_exceptions=False):
     """
     Check if a position is in the forbidden zone
     pos: wheel position (0-68)
     allow_early_exceptions: whether to allow positions 3 and 23 (for early dimensions)
     """
-    if pos % 3 == 0:
-        if allow_early_exceptions and pos in [3, 23]:
-            return False  # Not forbidden in early dimensions
-        return True  # Forbidden
-    return False  # Allowed
+    mask = FORBIDDEN_MASK_EARLY if allow_early_exceptions else FORBIDDEN_MASK
+    return bool((mask >> pos) & 1)
+
+# π to 100 decimal places, scaled to an integer - floor(π^d) by exact integer
+# arithmetic (floats go wrong from d = 30, and this stays exact up to d = 197)
+_PI_DIGITS = 100
+_PI_SCALED = 31415926535897932384626433832795028841971693993751058209749445923078164062862089986280348253421170679
+
+# Upper bounds floor(π^d) for dimensions 1-100, computed once
+_PI_BOUNDS = [_PI_SCALED ** d // 10 ** (_PI_DIGITS * d) for d in range(1, 101)]
 
 def get_dimension_for_number(n):
     """Determine which π-dimension a number belongs to"""
     if n <= 1:
         return 0
     
-    # Use high precision π for large numbers
-    if GMPY2_AVAILABLE:
-        pi = float(gmpy2.const_pi())
-    else:
-        pi = math.pi
-    
     # Find dimension d where floor(π^(d-1)) < n <= floor(π^d)
-    d = 1
-    while True:
-        upper_bound = math.floor(pi ** d)
-        if n <= upper_bound:
-            return d
-        d += 1
-        if d > 100:  # Safety check
-            return d
+    # (101 past the last precomputed bound, as a safety cap)
+    return bisect.bisect_left(_PI_BOUNDS, n) + 1
+
+def count_digits(n):
+    """Decimal digit count from bit_length - avoids the quadratic int -> str conversion"""
+    n = abs(n)
+    digits = (max(n.bit_length(), 1) - 1) * 1233 // 4096 + 1  # 1233/4096 just under log10(2)
+    while n >= 10 ** digits:
+        digits += 1
+    return digits
+
+# CPython's default int -> str limit - bigger numbers are shown by their last digits
+_MAX_DISPLAY_DIGITS = 4300
+
+def format_number(n, num_digits):
+    """Decimal string for display, abbreviated past _MAX_DISPLAY_DIGITS digits"""
+    if num_digits <= _MAX_DISPLAY_DIGITS:
+        return str(n)
+    return f"...{n % 10**20:020d} ({num_digits:,} digits)"
 
 def dart69_precheck(n):
     """
     Use dart-69 system to quickly check if a number could be prime
+    All tests run inline on n % 69 - the dimension is only looked up for the
+    one position (3) that has an early-dimension exception
     Returns: (could_be_prime, reason, position, angle)
     """
-    n = int(n)
+    # ints pass straight through; mpz/str/float are converted once so the
+    # position comes back as a plain int
+    if not isinstance(n, int):
+        n = int(n)
     
     # Handle special cases
     if n < 2:
         return False, "Less than 2", 0, 0
     if n == 2:
-        return True, "Special case: 2", 2, get_dart69_angle(2)
+        return True, "Special case: 2", 2, 2 * (360 / 69)
     if n == 3:
-        return True, "Special case: 3", 3, get_dart69_angle(3)
-    if n % 2 == 0:
-        return False, "Even number", get_dart69_position(n), get_dart69_angle(n)
+        return True, "Special case: 3", 3, 3 * (360 / 69)
     
-    # Get dart-69 position and angle
-    position = get_dart69_position(n)
-    angle = get_dart69_angle(n)
+    # Dart-69 position and angle
+    position = n % 69
+    angle = position * (360 / 69)
     
-    # Determine dimension for exception handling
-    dimension = get_dimension_for_number(n)
-    allow_exceptions = dimension <= 3
+    if n % 2 == 0:
+        return False, "Even number", position, angle
     
-    # Check forbidden zones
-    if is_forbidden_position(position, allow_exceptions):
-        if position == 3:
-            return False, f"Forbidden zone (pos 3, only prime 3 allowed)", position, angle
-        elif position == 23:
-            return False, f"Forbidden zone (pos 23, only prime 23 allowed)", position, angle
-        else:
+    # Check forbidden zones (position 23 is never a multiple of 3, so only 3 is special)
+    if (FORBIDDEN_MASK >> position) & 1:
+        if position != 3:
             return False, f"Forbidden zone (position {position})", position, angle
+        if is_forbidden_position(position, get_dimension_for_number(n) <= 3):
+            return False, f"Forbidden zone (pos 3, only prime 3 allowed)", position, angle
     
     # Passed dart-69 precheck
     return True, f"Allowed position {position}", position, angle
@@ -129,14 +179,14 @@ def check_prime_with_dart69(n):
     Returns detailed results
     """
     start_time = time.time()
-    n_str = str(n)
+    num_digits = count_digits(n)
+    n_str = format_number(n, num_digits)
     
     print(f"\n{'='*80}")
     print(f"DART-69 PRIME CHECK: {n_str}")
     print(f"{'='*80}")
     
     # Basic info
-    num_digits = len(n_str)
     dimension = get_dimension_for_number(n)
     
     print(f"Number: {n_str}")
@@ -198,20 +248,15 @@ def find_nearby_primes(n, count=5):
     print(f"\nFINDING {count} PRIMES NEAR {n}:")
     print("-" * 50)
     
-    # Find previous primes
+    # Find previous primes (prev_prime needs an argument >= 3 - stop once we reach 2)
     current = gmpy2.mpz(n)
     prev_primes = []
     
-    for i in range(count):
-        try:
-            prev_prime = prev_prime(current - 1) if i == 0 else prev_prime(current)
-            if prev_prime > 0:
-                prev_primes.append(int(prev_prime))
-                current = prev_prime
-            else:
-                break
-        except:
+    for _ in range(count):
+        if current <= 2:
             break
+        current = prev_prime(current)
+        prev_primes.append(int(current))
     
     prev_primes.reverse()
     
@@ -219,17 +264,12 @@ def find_nearby_primes(n, count=5):
     current = gmpy2.mpz(n)
     next_primes = []
     
-    for i in range(count):
-        try:
-            next_prime_val = next_prime(current + 1) if i == 0 else next_prime(current)
-            next_primes.append(int(next_prime_val))
-            current = next_prime_val
-        except:
-            break
+    for _ in range(count):
+        current = next_prime(current)
+        next_primes.append(int(current))
     
-    # Display results
+    # Display results (both halves ascending and prev < n < next - already sorted)
     all_primes = prev_primes + next_primes
-    all_primes.sort()
     
     print("Prime | Dart-69 Position | Angle | Distance from input")
     print("-" * 60)
@@ -283,14 +323,9 @@ def interactive_checker():
                         print("Please enter a reasonable number of digits (1-1000)")
                         continue
                     
-                    # Generate random number with specified digits
-                    import random
-                    if digits == 1:
-                        number = random.randint(1, 9)
-                    else:
-                        first_digit = random.randint(1, 9)
-                        remaining = ''.join(str(random.randint(0, 9)) for _ in range(digits - 1))
-                        number = int(str(first_digit) + remaining)
+                    # Generate random number with specified digits in [10^(d-1), 10^d)
+                    lowest = 10 ** (digits - 1)
+                    number = lowest + secrets.randbelow(9 * lowest)
                     
                     print(f"Random {digits}-digit number: {number}")
                     check_prime_with_dart69(number)
@@ -325,35 +360,59 @@ def interactive_checker():
         except Exception as e:
             print(f"Error: {e}")
 
-def batch_check(numbers):
-    """Check multiple numbers at once"""
+# Below this many numbers per worker, process start-up costs more than it saves
+_MIN_NUMBERS_PER_WORKER = 256
+
+def _check_one(n):
+    """Worker for batch_check - returns (n, is_prime, reason, filtered, nanoseconds)"""
+    start_ns = time.perf_counter_ns()
+    could_be_prime, reason, pos, angle = dart69_precheck(n)
+    
+    if not could_be_prime:
+        return n, False, reason, True, time.perf_counter_ns() - start_ns
+    
+    is_prime_result = is_prime_fast(n)
+    elapsed_ns = time.perf_counter_ns() - start_ns
+    return n, is_prime_result, f"{'Prime' if is_prime_result else 'Composite'} at pos {pos}", False, elapsed_ns
+
+def batch_check(numbers, workers=None):
+    """
+    Check multiple numbers at once
+    Each test is independent, so large batches are spread over worker processes
+    (the Python-level test loop holds the GIL). Results are printed in input order.
+    """
     print(f"🎯 BATCH PRIME CHECK - {len(numbers)} numbers")
     print("=" * 60)
     
     results = []
-    total_time = 0
+    total_ns = 0
     dart69_filtered = 0
     
-    for i, n in enumerate(numbers):
-        print(f"\n[{i+1}/{len(numbers)}] Checking {n}...")
-        
-        start_time = time.time()
-        could_be_prime, reason, pos, angle = dart69_precheck(n)
-        
-        if not could_be_prime:
-            dart69_filtered += 1
-            result = False, reason
-            elapsed = time.time() - start_time
-            print(f"  🚫 Filtered by dart-69: {reason} ({elapsed:.6f}s)")
-        else:
-            is_prime_result = is_prime_fast(n)
-            elapsed = time.time() - start_time
-            result = is_prime_result, f"{'Prime' if is_prime_result else 'Composite'} at pos {pos}"
-            status = "🎯 PRIME" if is_prime_result else "🚫 COMPOSITE"
-            print(f"  {status} ({elapsed:.6f}s)")
-        
-        results.append((n, result[0], result[1]))
-        total_time += elapsed
+    workers = min(workers or os.cpu_count() or 1, len(numbers) // _MIN_NUMBERS_PER_WORKER)
+    
+    if workers > 1:
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        checked = pool.map(_check_one, numbers, chunksize=max(1, len(numbers) // (8 * workers)))
+    else:
+        pool = None
+        checked = map(_check_one, numbers)
+    
+    try:
+        for i, (n, is_prime_result, reason, filtered, elapsed_ns) in enumerate(checked):
+            print(f"\n[{i+1}/{len(numbers)}] Checking {n}...")
+            
+            if filtered:
+                dart69_filtered += 1
+                print(f"  🚫 Filtered by dart-69: {reason} ({elapsed_ns / 1e9:.6f}s)")
+            else:
+                status = "🎯 PRIME" if is_prime_result else "🚫 COMPOSITE"
+                print(f"  {status} ({elapsed_ns / 1e9:.6f}s)")
+            
+            results.append((n, is_prime_result, reason))
+            total_ns += elapsed_ns
+    finally:
+        if pool is not None:
+            pool.shutdown()
     
     # Summary
     print(f"\n{'='*60}")
@@ -361,6 +420,7 @@ def batch_check(numbers):
     print(f"Numbers checked: {len(numbers)}")
     print(f"Filtered by dart-69: {dart69_filtered} ({dart69_filtered/len(numbers)*100:.1f}%)")
     print(f"Full tests needed: {len(numbers) - dart69_filtered}")
+    total_time = total_ns / 1e9
     print(f"Total time: {total_time:.3f} seconds")
     print(f"Average per number: {total_time/len(numbers):.6f} seconds")
     
@@ -4,11 +4,12 @@ DART-69 High-Performance Prime Sieve
 Professional implementation with gmpy2 optimization
 """
 
+import functools
 import math
 import time
 import argparse
 import sys
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 
 try:
     import gmpy2
@@ -18,6 +19,46 @@ except ImportError:
     HAS_GMPY2 = False
     print("⚠️  gmpy2 not found - install with: pip install gmpy2")
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# π to 100 decimal places, scaled to an integer - floor(π^d) by exact integer
+# arithmetic (floats go wrong from d = 30, and this stays exact up to d = 197)
+PI_DIGITS = 100
+PI_SCALED = 31415926535897932384626433832795028841971693993751058209749445923078164062862089986280348253421170679
+
+def floor_pi_power(d: int) -> int:
+    """floor(π^d) from the scaled integer π."""
+    return PI_SCALED ** d // 10 ** (PI_DIGITS * d)
+
+# DART-69 filter masks - bit i of SECTOR_FORBIDDEN_MASK is set when sector i is a
+# multiple of 3 or 23, bit d of DIGIT_ALLOWED_MASK when a prime > 5 can end in d
+SECTOR_FORBIDDEN_MASK = sum(1 << i for i in range(69) if i % 3 == 0 or i % 23 == 0)
+DIGIT_ALLOWED_MASK = sum(1 << d for d in (1, 3, 7, 9))
+
+# Primes below 1000 and their product - one gcd rules out all of them as factors
+SMALL_PRIMES = frozenset(p for p in range(2, 1000) if all(p % q for q in range(2, math.isqrt(p) + 1)))
+SMALL_PRIMORIAL = math.prod(SMALL_PRIMES)
+
+# Trial divisors for is_prime_basic - primes from 5 to 10000, then 6k±1 beyond
+TRIAL_PRIMES = tuple(p for p in range(5, 10000, 2) if all(p % q for q in range(3, math.isqrt(p) + 1, 2)))
+TRIAL_LIMIT = 10001  # first 6k-1 number after the table
+
+# GMP trial-divides small operands itself - the primorial gcd only pays off above this size
+GCD_PRECHECK_BITS = 256
+
+# dart69_filter depends only on n % 690 (690 = lcm(69, 10)), apart from 3 and 23
+WHEEL_PERIOD = 690
+if HAS_NUMPY:
+    WHEEL_690 = np.array([not (SECTOR_FORBIDDEN_MASK >> (i % 69)) & 1
+                          and (DIGIT_ALLOWED_MASK >> (i % 10)) & 1
+                          for i in range(WHEEL_PERIOD)], dtype=bool)
+    # Odd residues only - entry k is residue 2k+1
+    WHEEL_ODD = WHEEL_690[1::2]
+
 class DART69Sieve:
     """Ultra-fast DART-69 prime sieve with gmpy2 optimization."""
     
@@ -30,30 +71,82 @@ class DART69Sieve:
         if dimension == 1:
             return 2, 3
         
-        if self.use_gmpy2:
-            pi = gmpy2.const_pi()
-            start = int(gmpy2.floor(pi ** (dimension - 1))) + 1
-            end = int(gmpy2.floor(pi ** dimension))
-        else:
-            start = math.floor(math.pi ** (dimension - 1)) + 1
-            end = math.floor(math.pi ** dimension)
+        start = floor_pi_power(dimension - 1) + 1
+        end = floor_pi_power(dimension)
         
         return start, end
     
     def dart69_filter(self, n: int) -> bool:
         """DART-69 angular + digit filtering."""
         # Angular filter
-        sector = n % 69
-        if (sector % 3 == 0 or sector % 23 == 0) and n not in (3, 23):
+        if (SECTOR_FORBIDDEN_MASK >> (n % 69)) & 1 and n not in (3, 23):
             return False
         
         # Digit filter
-        return n % 10 in (1, 3, 7, 9)
+        return bool((DIGIT_ALLOWED_MASK >> (n % 10)) & 1)
+    
+    def test_segment(self, lo: int, hi: int) -> Tuple[int, List[int]]:
+        """
+        DART-69 primes in [lo, hi) by filtering and testing each number.
+        
+        Returns:
+            (number of dart69_filter candidates, primes)
+        """
+        candidates = [n for n in range(lo, hi) if self.dart69_filter(n)]
+        return len(candidates), [n for n in candidates if self.is_prime(n)]
+    
+    @staticmethod
+    def odd_base_primes(limit: int) -> List[int]:
+        """Odd primes up to limit, by a classical Sieve of Eratosthenes."""
+        is_prime = np.ones(limit + 1, dtype=bool)
+        is_prime[:2] = False
+        for i in range(2, math.isqrt(limit) + 1):
+            if is_prime[i]:
+                is_prime[i*i::i] = False
+        return np.flatnonzero(is_prime)[1:].tolist()
+    
+    def sieve_segment(self, lo: int, hi: int, base_primes: List[int]) -> Tuple[int, 'np.ndarray']:
+        """
+        DART-69 primes in [lo, hi) from an odd-only segmented sieve.
+        
+        Entry j of the segment stands for the odd number first + 2*j; the
+        wheel-69 mask and the crossed-off multiples are combined in one pass.
+        base_primes must cover every odd prime up to sqrt(hi).
+        
+        Returns:
+            (number of dart69_filter candidates, int64 array of primes)
+        """
+        first = lo | 1
+        count = max(0, (hi - first + 1) // 2)
+        
+        # Odd numbers walk the odd half of the 690-wheel, so tile it from first's residue
+        offset = first % WHEEL_PERIOD // 2
+        keep = np.tile(WHEEL_ODD, (offset + count) // len(WHEEL_ODD) + 1)[offset:offset + count]
+        for exception in (3, 23):
+            if first <= exception < hi:
+                keep[(exception - first) // 2] = True
+        
+        # Odd multiples of p are 2p apart, i.e. p entries apart in the segment
+        composite = np.zeros(count, dtype=bool)
+        if first == 1 and count:
+            composite[0] = True  # 1 passes the filter but is not prime
+        for p in base_primes:
+            if p * p >= hi:
+                break
+            start = max(p * p, (first + p - 1) // p * p)
+            if start % 2 == 0:
+                start += p
+            composite[(start - first) // 2::p] = True
+        
+        primes = first + 2 * np.flatnonzero(keep & ~composite).astype(np.int64)
+        return int(np.count_nonzero(keep)), primes
     
     def is_prime_gmpy2(self, n: int) -> bool:
         """Ultra-fast primality test using gmpy2."""
         if n < 2:
             return False
+        if n.bit_length() > GCD_PRECHECK_BITS and gmpy2.gcd(n, SMALL_PRIMORIAL) != 1:
+            return False
         return gmpy2.is_prime(n) != 0
     
     def is_prime_basic(self, n: int) -> bool:
@@ -69,9 +162,14 @@ class DART69Sieve:
         if n % 3 == 0:
             return False
         
-        # 6k±1 optimization
-        limit = int(math.sqrt(n)) + 1
-        for i in range(5, limit, 6):
+        # Table of small primes first, then the 6k±1 optimization
+        limit = math.isqrt(n)
+        for p in TRIAL_PRIMES:
+            if p > limit:
+                return True
+            if n % p == 0:
+                return False
+        for i in range(TRIAL_LIMIT, limit + 1, 6):
             if n % i == 0 or n % (i + 2) == 0:
                 return False
         return True
@@ -84,7 +182,7 @@ class DART69Sieve:
             return self.is_prime_basic(n)
     
     def sieve_dimension(self, dimension: int, show_progress: bool = True, 
-                       chunk_size: int = 1000000) -> List[int]:
+                       chunk_size: int = 1000000) -> Union[List[int], 'np.ndarray']:
         """
         Sieve a complete π-dimension for primes.
         
@@ -94,33 +192,47 @@ class DART69Sieve:
             chunk_size: Numbers to process per progress update
         
         Returns:
-            List of all primes in the dimension
+            All primes in the dimension - an int64 numpy array when the
+            numpy sieve is used (8 bytes per prime instead of a Python int
+            each), otherwise a list
         """
         start_time = time.perf_counter()
         start_num, end_num = self.get_dimension_range(dimension)
         total_numbers = end_num - start_num + 1
         
+        # Below 2^63 numpy sieves each chunk outright; gmpy2 / trial division only test beyond it
+        use_numpy = HAS_NUMPY and end_num < 2**63
+        
         if show_progress:
             print(f"\n🎯 DART-69 Sieve D{dimension}")
             print(f"Range: {start_num:,} to {end_num:,} ({total_numbers:,} numbers)")
-            print(f"Engine: {'gmpy2' if self.use_gmpy2 else 'pure Python'}")
+            if use_numpy:
+                print("Engine: numpy segmented sieve")
+            else:
+                print(f"Engine: {'gmpy2' if self.use_gmpy2 else 'pure Python'}")
             print("-" * 60)
         
-        primes = []
+        segments = []
+        primes_found = 0
         processed = 0
         candidates_tested = 0
         last_progress_time = start_time
         
-        for n in range(start_num, end_num + 1):
-            processed += 1
-            
-            # Apply DART-69 filters
-            if self.dart69_filter(n):
-                candidates_tested += 1
-                
-                # Prime test
-                if self.is_prime(n):
-                    primes.append(n)
+        if use_numpy:
+            # Sieve one chunk at a time - no per-number primality tests at all
+            base_primes = self.odd_base_primes(math.isqrt(end_num))
+            process_segment = functools.partial(self.sieve_segment, base_primes=base_primes)
+        else:
+            process_segment = self.test_segment
+        
+        # Progress is reported between chunks, never from inside a chunk
+        for seg_start in range(start_num, end_num + 1, chunk_size):
+            seg_end = min(seg_start + chunk_size, end_num + 1)
+            candidates, segment_primes = process_segment(seg_start, seg_end)
+            candidates_tested += candidates
+            segments.append(segment_primes)
+            primes_found += len(segment_primes)
+            processed = seg_end - start_num
             
             # Progress updates
             if show_progress and processed % chunk_size == 0:
@@ -137,12 +249,17 @@ class DART69Sieve:
                 eta_sec = int(eta_seconds % 60)
                 
                 print(f"Progress: {progress:6.2f}% | "
-                      f"Primes: {len(primes):,} | "
+                      f"Primes: {primes_found:,} | "
                       f"Speed: {chunk_speed:,.0f}/sec | "
                       f"ETA: {eta_min:02d}:{eta_sec:02d}", end='\r')
                 
                 last_progress_time = current_time
         
+        if use_numpy:
+            primes = np.concatenate(segments) if segments else np.empty(0, dtype=np.int64)
+        else:
+            primes = [p for segment_primes in segments for p in segment_primes]
+        
         total_time = time.perf_counter() - start_time
         
         # Store statistics
@@ -235,7 +352,8 @@ def main():
     parser.add_argument('--max-dim', type=int, default=12,
                        help='Maximum dimension for benchmark (default: 12)')
     parser.add_argument('--no-gmpy2', action='store_true',
-                       help='Disable gmpy2 even if available')
+                       help='Disable gmpy2 even if available (only matters at or above 2^63, '
+                            'or without numpy - the numpy sieve never tests single numbers)')
     parser.add_argument('--save', type=str,
                        help='Save primes to file (CSV format)')
     parser.add_argument('--quiet', action='store_true',
@@ -278,17 +396,23 @@ def main():
         print(f"\n🎉 Found {len(primes):,} primes in D{dimension}")
         
         if len(primes) <= 20:
-            print(f"Primes: {primes}")
+            print(f"Primes: {list(map(int, primes))}")
         else:
-            print(f"First 10: {primes[:10]}")
-            print(f"Last 10:  {primes[-10:]}")
+            print(f"First 10: {list(map(int, primes[:10]))}")
+            print(f"Last 10:  {list(map(int, primes[-10:]))}")
     
     # Save if requested
     if args.save:
-        with open(args.save, 'w') as f:
-            f.write("prime\n")
-            for p in primes:
-                f.write(f"{p}\n")
+        if HAS_NUMPY and isinstance(primes, np.ndarray):
+            np.savetxt(args.save, primes, fmt='%d', header='prime', comments='')
+        else:
+            # Write in joined blocks rather than one formatted write per prime
+            chunk = 1 << 16
+            with open(args.save, 'w') as f:
+                f.write("prime\n")
+                for i in range(0, len(primes), chunk):
+                    f.write("\n".join(map(str, primes[i:i + chunk])))
+                    f.write("\n")
         print(f"💾 Saved {len(primes):,} primes to {args.save}")
 
 if __name__ == "__main__":
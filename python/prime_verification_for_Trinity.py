@@ -12,20 +12,87 @@ Systematically verify all claims made in the prime number theory papers:
 This script provides rigorous mathematical verification of each claim.
 """
 
+import bisect
+import concurrent.futures
+import contextlib
+import io
 import math
+import os
+import sys
 import numpy as np
-from collections import defaultdict, Counter
+from collections import defaultdict
 import matplotlib.pyplot as plt
 from typing import List, Dict, Tuple, Set
 import time
+from primes_core import prime_sieve, primes_up_to
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Miller-Rabin with these witnesses is exact for n < 3.3*10^24 (OEIS A014233)
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Sector frequencies of the angular verifications (int(freq) sectors of 360°/freq each):
+# 24 sectors of 15° for density convergence, plus the three Trinity frequencies
+_SECTOR_FREQUENCIES = (24, 69, 71, 138.5)
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _nb_bin_primes(primes, start, end, freqs, counts):
+        """
+        counts[j, s] += primes in sector s for sector frequency freqs[j] - one pass
+        over the primes, per-chunk histograms merged at the end
+        """
+        n = primes.shape[0]
+        chunks = min(n, 64)
+        local = np.zeros((chunks, counts.shape[0], counts.shape[1]), dtype=np.int64)
+        for c in prange(chunks):
+            for i in range(c * n // chunks, (c + 1) * n // chunks):
+                angle = ((primes[i] - start) / (end - start) * 360) % 360
+                for j in range(freqs.shape[0]):
+                    sector = min(int(angle * (freqs[j] / 360)), int(freqs[j]) - 1)
+                    local[c, j, sector] += 1
+        for c in range(chunks):
+            counts += local[c]
+
+# Below this many primes per worker, process startup and pickling cost more than the binning
+_MIN_PRIMES_PER_WORKER = 1 << 17
+
+def _bin_dimension(primes: np.ndarray, start: int, end: int) -> Dict[float, np.ndarray]:
+    """Per-sector counts of one dimension's primes (in [start, end]) for every sector frequency"""
+    if NUMBA_AVAILABLE:
+        freqs = np.array(_SECTOR_FREQUENCIES, dtype=np.float64)
+        counts = np.zeros((len(freqs), int(freqs.max())), dtype=np.int64)
+        _nb_bin_primes(primes, start, end, freqs, counts)
+        return {freq: counts[j, :int(freq)] for j, freq in enumerate(_SECTOR_FREQUENCIES)}
+    
+    angle_degrees = ((primes - start) / (end - start) * 360) % 360
+    return {
+        freq: np.bincount(PrimeVerificationSuite._sector_indices(angle_degrees, freq), minlength=int(freq))
+        for freq in _SECTOR_FREQUENCIES
+    }
 
 class PrimeVerificationSuite:
     def __init__(self, max_n: int = 1000000):
         """Initialize with precomputed primes up to max_n"""
         self.max_n = max_n
         print(f"Generating primes up to {max_n:,}...")
-        self.primes = self._sieve_of_eratosthenes(max_n)
-        self.prime_set = set(self.primes)
+        # Shared with any other analysis in this process and cached on disk
+        self.primes = primes_up_to(max_n)
+        # One bit per number (bit n & 7 of byte n >> 3), set straight from the primes -
+        # 8x smaller than a bool sieve, which is never materialized
+        bits = np.zeros(max((max_n >> 3) + 1, 0), dtype=np.uint8)
+        np.bitwise_or.at(bits, self.primes >> 3, (1 << (self.primes & 7)).astype(np.uint8))
+        self._prime_bits = bits.tobytes()
+        # dim -> (start, end, lo, hi), shared by all verification methods
+        self._dim_cache = {}
+        # dim -> {frequency: per-sector prime counts}, shared by the angular verifications
+        self._bin_cache = {}
+        # π^k for k = 0..63, computed once
+        self._pi_pows = [math.pi ** k for k in range(64)]
         print(f"Generated {len(self.primes):,} primes for analysis")
         
         # Known Mersenne prime exponents (as of 2024)
@@ -37,37 +104,137 @@ class PrimeVerificationSuite:
             25964951, 30402457, 32582657, 37156667, 42643801, 43112609, 
             57885161, 74207281, 77232917, 82589933, 136279841
         ]
+        self.mersenne_exponents_arr = np.asarray(self.mersenne_exponents, dtype=np.int64)
+        self._mersenne_mod22 = self.mersenne_exponents_arr % 22
+        self._mersenne_mod_2_22 = self.mersenne_exponents_arr % (1 << 22)
         
-    def _sieve_of_eratosthenes(self, n: int) -> List[int]:
-        """Generate all primes up to n using Sieve of Eratosthenes"""
-        if n < 2:
-            return []
-        
-        sieve = [True] * (n + 1)
-        sieve[0] = sieve[1] = False
-        
-        for i in range(2, int(n**0.5) + 1):
-            if sieve[i]:
-                for j in range(i*i, n + 1, i):
-                    sieve[j] = False
-        
-        return [i for i in range(2, n + 1) if sieve[i]]
+    def _sieve_of_eratosthenes(self, n: int) -> np.ndarray:
+        """Sieve of Eratosthenes up to n - returns the bool array, True at primes"""
+        return prime_sieve(n)
     
     def is_prime(self, n: int) -> bool:
         """Check if number is prime"""
-        return n in self.prime_set if n <= self.max_n else self._trial_division(n)
+        if 0 <= n <= self.max_n:
+            return bool(self._prime_bits[n >> 3] >> (n & 7) & 1)
+        return self._trial_division(n)
+    
+    def _prime_mask(self, start: int, stop: int) -> np.ndarray:
+        """Bool array over [start, stop), True at primes - unpacked from the prime bitmap"""
+        mask = np.zeros(max(stop - start, 0), dtype=np.bool_)
+        lo, hi = max(start, 0), min(stop, self.max_n + 1)
+        if lo < hi:
+            bits = np.unpackbits(np.frombuffer(self._prime_bits[lo >> 3:((hi - 1) >> 3) + 1], dtype=np.uint8),
+                                 bitorder='little')
+            mask[lo - start:hi - start] = bits[lo & 7:(lo & 7) + hi - lo]
+        for n in range(max(hi, start), stop):
+            mask[n - start] = self._trial_division(n)
+        return mask
+    
+    def _primes_in_range(self, start: int, end: int) -> np.ndarray:
+        """Primes in [start, end] as a view of the sorted prime array (two binary searches)"""
+        lo = np.searchsorted(self.primes, start)
+        hi = np.searchsorted(self.primes, end, side='right')
+        return self.primes[lo:hi]
+    
+    def _prime_angles(self, dim: int) -> np.ndarray:
+        """Angular position (relative position * 360°) of every prime in dimension dim"""
+        start, end, lo, hi = self._dimension_bounds(dim)
+        return ((self.primes[lo:hi] - start) / (end - start) * 360) % 360
+    
+    @staticmethod
+    def _sector_indices(angle_degrees: np.ndarray, freq: float) -> np.ndarray:
+        """Sector of each angle, for int(freq) sectors of 360°/freq (the last takes any remainder)"""
+        return np.minimum((angle_degrees * (freq / 360)).astype(np.int64), int(freq) - 1)
+    
+    def _bin_primes(self, dim: int) -> Dict[float, np.ndarray]:
+        """Per-sector prime counts of dimension dim for every sector frequency, from one angle pass"""
+        if dim not in self._bin_cache:
+            start, end, lo, hi = self._dimension_bounds(dim)
+            self._bin_cache[dim] = _bin_dimension(self.primes[lo:hi], start, end)
+        return self._bin_cache[dim]
+    
+    def _bin_dimensions(self, dimensions: List[int], workers: int = None):
+        """
+        Fill the bin cache for several dimensions, one dimension per worker process.
+        The compiled binning is already multi-threaded, so it stays in-process.
+        """
+        pending = [dim for dim in dict.fromkeys(dimensions) if dim >= 1 and dim not in self._bin_cache]
+        bounds = {dim: self._dimension_bounds(dim) for dim in pending}
+        total_primes = sum(hi - lo for start, end, lo, hi in bounds.values())
+        workers = min(workers or os.cpu_count() or 1, len(pending), total_primes // _MIN_PRIMES_PER_WORKER)
+        if NUMBA_AVAILABLE or workers < 2:
+            for dim in pending:
+                self._bin_primes(dim)
+            return
+        
+        # Workers get only their dimension's slice of the prime array, never self
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                dim: pool.submit(_bin_dimension, self.primes[lo:hi], start, end)
+                for dim, (start, end, lo, hi) in bounds.items()
+            }
+            for dim, future in futures.items():
+                self._bin_cache[dim] = future.result()
+        finally:
+            pool.shutdown()
+    
+    @staticmethod
+    def _sector_samples(primes: np.ndarray, sectors: np.ndarray, num_sectors: int, k: int = 3) -> List[List[int]]:
+        """First k primes of each sector (primes ascending, sectors their sector indices)"""
+        order = np.argsort(sectors, kind='stable')
+        starts = np.searchsorted(sectors[order], np.arange(num_sectors + 1))
+        return [primes[order[lo:min(lo + k, hi)]].tolist() for lo, hi in zip(starts[:-1], starts[1:])]
+    
+    def _pi_power(self, k: int) -> float:
+        """π^k from the precomputed table (computed directly outside 0..63)"""
+        return self._pi_pows[k] if 0 <= k < len(self._pi_pows) else math.pi ** k
+    
+    def _dimension_bounds(self, dim: int) -> Tuple[int, int, int, int]:
+        """(start, end, lo, hi) for π-dimension dim - its primes are self.primes[lo:hi]"""
+        if dim not in self._dim_cache:
+            start = math.floor(self._pi_power(dim - 1)) + 1 if dim > 1 else 1
+            end = math.floor(self._pi_power(dim))
+            lo = int(np.searchsorted(self.primes, start))
+            hi = int(np.searchsorted(self.primes, end, side='right'))
+            self._dim_cache[dim] = (start, end, lo, hi)
+        return self._dim_cache[dim]
     
     def _trial_division(self, n: int) -> bool:
-        """Trial division for numbers beyond precomputed range"""
+        """Primality for numbers beyond the precomputed range"""
         if n < 2:
             return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
         
-        for i in range(3, int(n**0.5) + 1, 2):
-            if n % i == 0:
+        # Divide by the sieved primes up to sqrt(n) in one vectorized pass
+        limit = math.isqrt(n)
+        if limit <= self.max_n and n < 2**63:
+            divisors = self.primes[:np.searchsorted(self.primes, limit, side='right')]
+            return not np.any(n % divisors == 0)
+        
+        # Past max_n^2 the sieve can't cover sqrt(n) - use Miller-Rabin
+        for p in _MR_WITNESSES:
+            if n % p == 0:
+                return n == p
+        return self._miller_rabin(n)
+    
+    @staticmethod
+    def _miller_rabin(n: int) -> bool:
+        """Miller-Rabin strong probable prime test for odd n > 41"""
+        d = n - 1
+        s = 0
+        while d % 2 == 0:
+            d //= 2
+            s += 1
+        
+        for a in _MR_WITNESSES:
+            x = pow(a, d, n)
+            if x == 1 or x == n - 1:
+                continue
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
                 return False
         return True
 
@@ -81,9 +248,13 @@ class PrimeVerificationSuite:
         results = {}
         for n in test_numbers:
             if n > 0:
-                pi_dim = math.floor(math.log(n) / math.log(math.pi))
-                pi_boundary = math.pi ** pi_dim
-                next_boundary = math.pi ** (pi_dim + 1)
+                if n < self._pi_pows[-1]:
+                    # Exact comparison against the π^k table - no log ratio roundoff at boundaries
+                    pi_dim = bisect.bisect_right(self._pi_pows, n) - 1
+                else:
+                    pi_dim = math.floor(math.log(n) / math.log(math.pi))
+                pi_boundary = self._pi_power(pi_dim)
+                next_boundary = self._pi_power(pi_dim + 1)
                 
                 results[n] = {
                     'pi_dimension': pi_dim,
@@ -103,9 +274,8 @@ class PrimeVerificationSuite:
         boundaries = {}
         
         for k in range(1, max_dimension + 1):
-            pi_k = math.pi ** k
-            start = math.floor(math.pi ** (k-1)) + 1 if k > 1 else 1
-            end = math.floor(pi_k)
+            pi_k = self._pi_power(k)
+            start, end, _, _ = self._dimension_bounds(k)
             range_size = end - start + 1
             
             boundaries[k] = {
@@ -122,8 +292,13 @@ class PrimeVerificationSuite:
             'boundaries': boundaries
         }
     
-    def verify_trinity_angular_analysis(self, dimensions: List[int] = [7, 8, 9, 10, 11, 12, 13, 14, 15]) -> Dict:
-        """Verify Trinity-based angular analysis using 69, 71, and 138.5 degree boundaries"""
+    def verify_trinity_angular_analysis(self, dimensions: List[int] = [7, 8, 9, 10, 11, 12, 13, 14, 15],
+                                        verbose: bool = False, workers: int = None) -> Dict:
+        """
+        Verify Trinity-based angular analysis using 69, 71, and 138.5 degree boundaries
+        verbose: also report per-sector sector_details (count, density, first 3 primes)
+        workers: processes for binning the dimensions (default: one per CPU)
+        """
         trinity_data = {}
         
         # Trinity frequencies and their angular quantum
@@ -138,17 +313,18 @@ class PrimeVerificationSuite:
         for name, data in trinity_frequencies.items():
             print(f"  {name}: {data['angular_quantum']:.3f}° per sector ({data['sectors']} sectors)")
         
+        self._bin_dimensions(dimensions, workers)
+        
         for dim in dimensions:
             if dim < 1:
                 continue
                 
             # Calculate dimension boundaries
-            start = math.floor(math.pi ** (dim-1)) + 1 if dim > 1 else 1
-            end = math.floor(math.pi ** dim)
+            start, end, lo, hi = self._dimension_bounds(dim)
             range_size = end - start + 1
             
             # Find primes in this dimension
-            primes_in_dim = [p for p in self.primes if start <= p <= end and p <= self.max_n]
+            primes_in_dim = self.primes[lo:hi]
             
             if len(primes_in_dim) == 0:
                 print(f"  D{dim}: No primes found - need larger prime set")
@@ -161,56 +337,32 @@ class PrimeVerificationSuite:
                 'trinity_analysis': {}
             }
             
+            # Sector counts for every frequency, binned together
+            binned = self._bin_primes(dim)
+            
             # Analyze each Trinity frequency
             for trinity_name, trinity_info in trinity_frequencies.items():
                 angular_quantum = trinity_info['angular_quantum']
                 num_sectors = trinity_info['sectors']
-                
-                # Calculate angular positions for each prime
-                sector_counts = [0] * num_sectors
-                sector_primes = [[] for _ in range(num_sectors)]
-                
-                for p in primes_in_dim:
-                    # Angular position calculation
-                    relative_pos = (p - start) / (end - start)
-                    angle = relative_pos * 2 * math.pi
-                    angle_degrees = (angle * 180 / math.pi) % 360
-                    
-                    # Classify into Trinity sectors
-                    sector = min(int(angle_degrees / angular_quantum), num_sectors - 1)
-                    sector_counts[sector] += 1
-                    sector_primes[sector].append(p)
+                sector_counts = binned[trinity_info['freq']]
                 
                 # Calculate Trinity sector statistics
                 total_primes = len(primes_in_dim)
-                sector_densities = []
-                sector_details = {}
-                
-                for sector in range(num_sectors):
-                    count = sector_counts[sector]
-                    density = (count / total_primes * 100) if total_primes > 0 else 0
-                    sector_densities.append(density)
-                    
-                    if count > 0:
-                        sector_details[sector] = {
-                            'count': count,
-                            'density': density,
-                            'angle_range': f"{sector * angular_quantum:.1f}°-{(sector + 1) * angular_quantum:.1f}°",
-                            'sample_primes': sector_primes[sector][:3]
-                        }
+                densities = sector_counts / total_primes * 100
+                sector_densities = densities.tolist()
                 
                 # Calculate Trinity statistics
-                mean_density = np.mean(sector_densities)
-                std_density = np.std(sector_densities)
-                max_density = max(sector_densities) if sector_densities else 0
-                min_density = min(sector_densities) if sector_densities else 0
+                mean_density = densities.mean()
+                std_density = densities.std()
+                max_density = float(densities.max())
+                min_density = float(densities.min())
                 uniformity = 1 - (std_density / mean_density) if mean_density > 0 else 0
                 
                 # Expected uniform density for this Trinity frequency
                 expected_uniform = 100 / num_sectors
                 
                 # Find sectors with density close to 4.2%
-                sectors_near_4_2 = [i for i, d in enumerate(sector_densities) if abs(d - 4.2) < 0.5]
+                sectors_near_4_2 = np.flatnonzero(np.abs(densities - 4.2) < 0.5).tolist()
                 
                 dim_results['trinity_analysis'][trinity_name] = {
                     'angular_quantum': angular_quantum,
@@ -222,11 +374,24 @@ class PrimeVerificationSuite:
                     'uniformity': uniformity,
                     'expected_uniform': expected_uniform,
                     'sector_densities': sector_densities,
-                    'sector_details': sector_details,
                     'sectors_near_4_2': sectors_near_4_2,
                     'count_near_4_2': len(sectors_near_4_2)
                 }
                 
+                if verbose:
+                    # Per-sector details only for occupied sectors
+                    sectors = self._sector_indices(self._prime_angles(dim), trinity_info['freq'])
+                    sector_primes = self._sector_samples(primes_in_dim, sectors, num_sectors)
+                    dim_results['trinity_analysis'][trinity_name]['sector_details'] = {
+                        sector: {
+                            'count': int(sector_counts[sector]),
+                            'density': sector_densities[sector],
+                            'angle_range': f"{sector * angular_quantum:.1f}°-{(sector + 1) * angular_quantum:.1f}°",
+                            'sample_primes': sector_primes[sector]
+                        }
+                        for sector in np.flatnonzero(sector_counts).tolist()
+                    }
+                
                 print(f"  D{dim} Trinity-{trinity_name}: {total_primes:,} primes")
                 print(f"    {num_sectors} sectors of {angular_quantum:.3f}° each")
                 print(f"    Mean density: {mean_density:.3f}% (expected: {expected_uniform:.3f}%)")
@@ -293,61 +458,43 @@ class PrimeVerificationSuite:
             'trinity_frequencies': trinity_frequencies
         }
     
-    def verify_universal_density_convergence(self, dimensions: List[int] = [7, 8, 9, 10, 11, 12, 13, 14, 15]) -> Dict:
-        """Verify claim that all sectors converge to ~4.2% density after stabilization (D7+)"""
+    def verify_universal_density_convergence(self, dimensions: List[int] = [7, 8, 9, 10, 11, 12, 13, 14, 15],
+                                             verbose: bool = False, workers: int = None) -> Dict:
+        """
+        Verify claim that all sectors converge to ~4.2% density after stabilization (D7+)
+        verbose: also report per-sector all_sector_data (count, density, first 3 primes)
+        workers: processes for binning the dimensions (default: one per CPU)
+        """
         convergence_data = {}
         all_sector_data = {}
         
         print(f"Analyzing π-dimensions {dimensions[0]}-{dimensions[-1]} for density convergence...")
         
+        self._bin_dimensions(dimensions, workers)
+        
         for dim in dimensions:
-            start = math.floor(math.pi ** (dim-1)) + 1 if dim > 1 else 1
-            end = math.floor(math.pi ** dim)
+            start, end, lo, hi = self._dimension_bounds(dim)
             range_size = end - start + 1
             
             # Find primes in this dimension
-            primes_in_dim = [p for p in self.primes if start <= p <= end and p <= self.max_n]
+            primes_in_dim = self.primes[lo:hi]
             total_primes = len(primes_in_dim)
             
             if total_primes == 0:
                 print(f"  D{dim}: No primes found in range [{start}, {end}] - may need larger prime set")
                 continue
                 
-            # Calculate angular positions and classify into 24 sectors (15° each)
-            sector_counts = [0] * 24
-            sector_primes = [[] for _ in range(24)]
-            
-            for p in primes_in_dim:
-                # Angular position calculation from paper
-                relative_pos = (p - start) / (end - start)
-                angle = relative_pos * 2 * math.pi
-                angle_degrees = (angle * 180 / math.pi) % 360
-                
-                # Classify into 24 sectors (15° each)
-                sector = min(int(angle_degrees // 15), 23)
-                sector_counts[sector] += 1
-                sector_primes[sector].append(p)
+            # Counts in 24 sectors (15° each)
+            sector_counts = self._bin_primes(dim)[24]
             
             # Calculate sector densities
-            sector_densities = []
-            sector_data = {}
+            densities = sector_counts / total_primes * 100
+            sector_densities = densities.tolist()
             
-            for sector in range(24):
-                count = sector_counts[sector]
-                density = (count / total_primes * 100) if total_primes > 0 else 0
-                sector_densities.append(density)
-                
-                sector_data[sector] = {
-                    'count': count,
-                    'density': density,
-                    'angle_range': f"{sector * 15}°-{(sector + 1) * 15}°",
-                    'sample_primes': sector_primes[sector][:3]  # First 3 primes as examples
-                }
-            
-            mean_density = np.mean(sector_densities)
-            std_density = np.std(sector_densities)
-            min_density = min(sector_densities)
-            max_density = max(sector_densities)
+            mean_density = densities.mean()
+            std_density = densities.std()
+            min_density = float(densities.min())
+            max_density = float(densities.max())
             
             convergence_data[dim] = {
                 'range': [start, end],
@@ -362,7 +509,18 @@ class PrimeVerificationSuite:
                 'uniformity_score': 1 - (std_density / mean_density) if mean_density > 0 else 0
             }
             
-            all_sector_data[dim] = sector_data
+            if verbose:
+                sectors = self._sector_indices(self._prime_angles(dim), 24)
+                sector_primes = self._sector_samples(primes_in_dim, sectors, 24)
+                all_sector_data[dim] = {
+                    sector: {
+                        'count': count,
+                        'density': sector_densities[sector],
+                        'angle_range': f"{sector * 15}°-{(sector + 1) * 15}°",
+                        'sample_primes': sector_primes[sector]  # First 3 primes as examples
+                    }
+                    for sector, count in enumerate(sector_counts.tolist())
+                }
             
             print(f"  D{dim}: [{start:,}, {end:,}] → {total_primes:,} primes")
             print(f"        Mean density: {mean_density:.3f}% (σ={std_density:.3f})")
@@ -378,8 +536,8 @@ class PrimeVerificationSuite:
         for sector in high_consistency_sectors:
             densities_across_dims = []
             for dim in dimensions:
-                if dim in all_sector_data and sector in all_sector_data[dim]:
-                    densities_across_dims.append(all_sector_data[dim][sector]['density'])
+                if dim in convergence_data:
+                    densities_across_dims.append(convergence_data[dim]['sector_densities'][sector])
             
             if densities_across_dims:
                 mean_density = np.mean(densities_across_dims)
@@ -410,16 +568,18 @@ class PrimeVerificationSuite:
         else:
             overall_convergence = False
         
-        return {
+        results = {
             'claim': 'Universal density convergence to ~4.2% after D7 stabilization',
             'status': 'VERIFIED' if convergence_verified and overall_convergence else 'PARTIAL',
             'dimensions_tested': dimensions,
             'convergence_data': convergence_data,
             'sector_analysis': sector_analysis,
-            'all_sector_data': all_sector_data,
             'expected_density': 4.167,  # Theoretical uniform: 100/24
             'overall_convergence': overall_convergence
         }
+        if verbose:
+            results['all_sector_data'] = all_sector_data
+        return results
 
     # ===== DART-69 CLAIMS VERIFICATION =====
     
@@ -428,33 +588,30 @@ class PrimeVerificationSuite:
         start, end = test_range
         
         # DART-69 filter: wheel of 3×23=69, keep only last digits 1,3,7,9 (plus 2,5)
-        def dart69_filter(n):
-            if n in [2, 3, 5]:
-                return True
-            if n % 2 == 0 or n % 3 == 0 or n % 5 == 0:
-                return False
-            if n % 23 == 0:
-                return False
-            last_digit = n % 10
-            return last_digit in [1, 3, 7, 9]
+        numbers_tested = np.arange(start, end + 1)
+        last_digit = numbers_tested % 10
+        candidate_mask = ((numbers_tested % 2 != 0) & (numbers_tested % 3 != 0) &
+                          (numbers_tested % 5 != 0) & (numbers_tested % 23 != 0) &
+                          ((last_digit == 1) | (last_digit == 3) | (last_digit == 7) | (last_digit == 9)))
+        candidate_mask |= np.isin(numbers_tested, (2, 3, 5))
         
         # Test the sieve
-        numbers_tested = list(range(start, end + 1))
-        dart_candidates = [n for n in numbers_tested if dart69_filter(n)]
-        actual_primes = [n for n in numbers_tested if self.is_prime(n)]
+        prime_mask = self._prime_mask(start, end + 1)
+        dart_candidates = int(np.count_nonzero(candidate_mask))
+        actual_primes = int(np.count_nonzero(prime_mask))
         
         # Calculate metrics
         total_numbers = len(numbers_tested)
-        total_eliminated = total_numbers - len(dart_candidates)
+        total_eliminated = total_numbers - dart_candidates
         elimination_rate = (total_eliminated / total_numbers) * 100
         
         # Check prime capture rate
-        primes_captured = [p for p in actual_primes if dart69_filter(p)]
-        prime_capture_rate = (len(primes_captured) / len(actual_primes)) * 100 if actual_primes else 0
+        primes_captured = int(np.count_nonzero(prime_mask & candidate_mask))
+        prime_capture_rate = (primes_captured / actual_primes) * 100 if actual_primes else 0
         
         # Check false positive rate
-        false_positives = [n for n in dart_candidates if not self.is_prime(n)]
-        false_positive_rate = (len(false_positives) / len(dart_candidates)) * 100 if dart_candidates else 0
+        false_positives = int(np.count_nonzero(candidate_mask & ~prime_mask))
+        false_positive_rate = (false_positives / dart_candidates) * 100 if dart_candidates else 0
         
         return {
             'claim': 'DART-69: 74.5% elimination, 100% prime capture',
@@ -466,9 +623,9 @@ class PrimeVerificationSuite:
                 'claimed_capture': 100.0,
                 'false_positive_rate': false_positive_rate,
                 'total_numbers': total_numbers,
-                'candidates_remaining': len(dart_candidates),
-                'actual_primes': len(actual_primes),
-                'primes_captured': len(primes_captured)
+                'candidates_remaining': dart_candidates,
+                'actual_primes': actual_primes,
+                'primes_captured': primes_captured
             }
         }
 
@@ -477,10 +634,7 @@ class PrimeVerificationSuite:
     def verify_trinity_frequencies(self, test_primes: List[int] = None) -> Dict:
         """Verify 69, 71.4, 138.5 frequency claims"""
         if test_primes is None:
-            test_primes = [p for p in self.primes if 100 <= p <= 10000]
-        
-        def calculate_phase(p, frequency):
-            return (math.sqrt(p) * 360 / frequency) % 360
+            test_primes = self._primes_in_range(100, 10000)
         
         # Test the claimed frequency relationships
         frequency_69 = 69
@@ -494,24 +648,18 @@ class PrimeVerificationSuite:
         # Check harmonic relationship: 138.5 ≈ 2 × 69
         harmonic_claim_verified = abs(frequency_138_5 - 2 * frequency_69) < 1.0
         
-        # Test phase calculations for sample primes
-        phase_data = {}
-        for p in test_primes[:100]:  # Test first 100 primes in range
-            phase_data[p] = {
-                'phase_69': calculate_phase(p, frequency_69),
-                'phase_71_4': calculate_phase(p, frequency_71_4),
-                'phase_138_5': calculate_phase(p, frequency_138_5)
-            }
+        # Phase of each sample prime at every frequency (first 100 distinct primes in range)
+        sample = np.unique(np.asarray(test_primes[:100]))
+        sqrt_p = np.sqrt(sample.astype(np.float64))
+        phases = [(sqrt_p * 360 / frequency) % 360
+                  for frequency in (frequency_69, frequency_71_4, frequency_138_5)]
         
-        # Check claimed angular preferences (150°, 330°, 225°)
+        # Check claimed angular preferences (150°, 330°, 225°) - within 5 degrees at any frequency
         preferred_angles = [150, 330, 225]
-        angle_preference_counts = {angle: 0 for angle in preferred_angles}
-        
-        for p, phases in phase_data.items():
-            for angle in preferred_angles:
-                for freq_key in ['phase_69', 'phase_71_4', 'phase_138_5']:
-                    if abs(phases[freq_key] - angle) < 5:  # Within 5 degrees
-                        angle_preference_counts[angle] += 1
+        angle_preference_counts = {
+            angle: sum(int(np.count_nonzero(np.abs(phase - angle) < 5)) for phase in phases)
+            for angle in preferred_angles
+        }
         
         return {
             'claim': 'Trinity frequencies 69, 71.4, 138.5 with specific angular preferences',
@@ -522,7 +670,7 @@ class PrimeVerificationSuite:
                 'harmonic_relationship_verified': harmonic_claim_verified,
                 'harmonic_ratio_actual': frequency_138_5 / frequency_69,
                 'angle_preferences': angle_preference_counts,
-                'sample_size': len(phase_data)
+                'sample_size': len(sample)
             }
         }
 
@@ -532,18 +680,16 @@ class PrimeVerificationSuite:
         """Verify Mersenne prime exponent patterns mod 22"""
         exponents = self.mersenne_exponents
         
-        # Calculate remainders mod 22
-        remainders = [p % 22 for p in exponents]
-        remainder_counts = Counter(remainders)
+        # Count remainders mod 22
+        remainder_counts = np.bincount(self._mersenne_mod22, minlength=22)
         
         # Check specific claims
-        remainder_5_count = remainder_counts[5]
+        remainder_5_count = int(remainder_counts[5])
         remainder_5_percentage = (remainder_5_count / len(exponents)) * 100
         
         # Check which remainders are absent
-        all_possible_remainders = set(range(22))
-        present_remainders = set(remainders)
-        absent_remainders = all_possible_remainders - present_remainders
+        present_remainders = np.flatnonzero(remainder_counts).tolist()
+        absent_remainders = np.flatnonzero(remainder_counts == 0).tolist()
         
         # Check even remainder pattern (should mostly be absent except 2)
         even_remainders_present = [r for r in present_remainders if r % 2 == 0]
@@ -560,13 +706,13 @@ class PrimeVerificationSuite:
                 'total_exponents': len(exponents),
                 'remainder_5_count': remainder_5_count,
                 'remainder_5_percentage': remainder_5_percentage,
-                'present_remainders': sorted(present_remainders),
-                'absent_remainders': sorted(absent_remainders),
+                'present_remainders': present_remainders,
+                'absent_remainders': absent_remainders,
                 'even_remainders_present': even_remainders_present,
                 'even_pattern_verified': even_pattern_verified,
                 'multiples_of_11_present': multiples_of_11_present,
                 'no_multiples_of_11_verified': no_multiples_of_11,
-                'remainder_distribution': dict(remainder_counts)
+                'remainder_distribution': {r: int(remainder_counts[r]) for r in present_remainders}
             }
         }
     
@@ -582,8 +728,8 @@ class PrimeVerificationSuite:
         theoretical_reduction_percentage = theoretical_reduction * 100
         
         # Check against actual Mersenne exponent mod 2^22 patterns
-        mod_2_22_remainders = [p % period for p in self.mersenne_exponents]
-        unique_positions = len(set(mod_2_22_remainders))
+        mod_2_22_positions = np.unique(self._mersenne_mod_2_22)
+        unique_positions = len(mod_2_22_positions)
         
         # Estimate actual search space reduction
         actual_reduction = 1 - (unique_positions / period)
@@ -602,7 +748,7 @@ class PrimeVerificationSuite:
                 'period_length': period,
                 'viable_positions_claimed': viable_positions,
                 'reduction_verified': reduction_claim_verified,
-                'mersenne_mod_positions': sorted(set(mod_2_22_remainders))
+                'mersenne_mod_positions': mod_2_22_positions.tolist()
             }
         }
 
@@ -619,8 +765,9 @@ class PrimeVerificationSuite:
         print("\n1. Verifying π-Dimensional Claims...")
         all_results['pi_dimension_definition'] = self.verify_pi_dimension_definition()
         all_results['pi_boundaries'] = self.verify_pi_dimensional_boundaries()
-        all_results['trinity_angular_analysis'] = self.verify_trinity_angular_analysis()
-        all_results['density_convergence'] = self.verify_universal_density_convergence()
+        # The per-sector details are never reported, so only the summary stats are built
+        all_results['trinity_angular_analysis'] = self.verify_trinity_angular_analysis(verbose=False)
+        all_results['density_convergence'] = self.verify_universal_density_convergence(verbose=False)
         
         # DART-69 Claims
         print("\n2. Verifying DART-69 Claims...")
@@ -662,6 +809,14 @@ class PrimeVerificationSuite:
 
 def print_detailed_results(results: Dict):
     """Print comprehensive detailed results of all verifications"""
+    # Build the report in memory and write it in one go
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        _print_detailed_results(results)
+    sys.stdout.write(output.getvalue())
+
+def _print_detailed_results(results: Dict):
+    """Report body for print_detailed_results"""
     print("\n" + "=" * 100)
     print("COMPREHENSIVE PRIME THEORY VERIFICATION RESULTS")
     print("=" * 100)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Shared Prime Sieve
+==================
+
+One sieve for the analysis scripts: primes_up_to(n) sieves once per process
+(lru_cache) and once per user (.npy cache in ~/.cache/dart69).
+"""
+
+import math
+import os
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Sieve window lengths: the compiled loop works in L1-sized 32 KB windows; the NumPy
+# fallback pays Python overhead per (window, prime) slice, so it uses 1 MB windows
+_NB_SEGMENT = 1 << 15
+_NP_SEGMENT = 1 << 20
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _nb_sieve(sieve, segment):
+        """Compiled segmented Eratosthenes over a preallocated all-True bool buffer"""
+        limit = sieve.shape[0]
+        sieve[:2] = False
+        sieve[4::2] = False
+        
+        # Odd base primes below sqrt(limit) with a plain sieve
+        root = min(int(limit ** 0.5) + 1, limit)
+        for p in range(3, int(root ** 0.5) + 1, 2):
+            if sieve[p]:
+                sieve[p*p:root:2*p] = False
+        base_primes = np.array([p for p in range(3, root, 2) if sieve[p]], dtype=np.int64)
+        
+        # The rest one cache-sized window at a time
+        for lo in range(root, limit, segment):
+            hi = min(lo + segment, limit)
+            for p in base_primes:
+                if p * p >= hi:
+                    break
+                first = max(p * p, (lo + p - 1) // p * p)
+                if first % 2 == 0:
+                    first += p
+                sieve[first:hi:2*p] = False
+
+def prime_sieve(n: int) -> np.ndarray:
+    """Sieve of Eratosthenes up to n - returns the bool array, True at primes"""
+    if n < 2:
+        return np.zeros(max(n + 1, 0), dtype=np.bool_)
+    
+    sieve = np.ones(n + 1, dtype=np.bool_)
+    
+    if NUMBA_AVAILABLE:
+        _nb_sieve(sieve, _NB_SEGMENT)
+    else:
+        sieve[:2] = False
+        sieve[4::2] = False
+        
+        # Odd base primes below sqrt(n), then the rest one window at a time
+        root = math.isqrt(n) + 1
+        for i in range(3, math.isqrt(root) + 1, 2):
+            if sieve[i]:
+                sieve[i*i:root:2*i] = False
+        base_primes = np.flatnonzero(sieve[:root])[1:].tolist()
+        
+        for lo in range(root, n + 1, _NP_SEGMENT):
+            hi = min(lo + _NP_SEGMENT, n + 1)
+            window = sieve[lo:hi]
+            for p in base_primes:
+                if p * p >= hi:
+                    break
+                first = max(p * p, -(-lo // p) * p)
+                if first % 2 == 0:
+                    first += p
+                window[first - lo::2*p] = False
+    
+    return sieve
+
+# Sieved primes are cached per user as .npy files in $XDG_CACHE_HOME/dart69 (~/.cache/dart69);
+# set DART69_NO_PRIME_CACHE, or clear this flag, to keep them off disk
+DISK_CACHE_ENABLED = not os.environ.get('DART69_NO_PRIME_CACHE')
+
+def _prime_cache_dir():
+    """The cache directory, created 0700 on first use - or None if disabled or unavailable"""
+    if not DISK_CACHE_ENABLED:
+        return None
+    try:
+        cache_dir = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'dart69'
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except (OSError, RuntimeError, KeyError):
+        return None
+    return cache_dir
+
+def _load_cached_primes(max_n: int):
+    """Primes up to max_n from the disk cache (read-only memmap), or None if not cached or not valid"""
+    cache_dir = _prime_cache_dir()
+    if max_n < 2 or cache_dir is None:
+        return None
+    try:
+        primes = np.load(cache_dir / f'dart69_primes_{max_n}.npy', mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    if primes.dtype != np.int64 or primes.ndim != 1 or primes.size == 0:
+        return None
+    return primes if primes[0] == 2 and primes[-1] <= max_n else None
+
+def _save_cached_primes(max_n: int, primes: np.ndarray):
+    """Write primes to the disk cache - best effort, written aside then renamed into place"""
+    cache_dir = _prime_cache_dir()
+    if cache_dir is None:
+        return
+    path = cache_dir / f'dart69_primes_{max_n}.npy'
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.asarray(primes, dtype=np.int64))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+@lru_cache(maxsize=4)
+def primes_up_to(n: int) -> np.ndarray:
+    """All primes up to n as a sorted, read-only int64 array - shared, so never modify it"""
+    primes = _load_cached_primes(n)
+    if primes is None:
+        primes = np.flatnonzero(prime_sieve(n)).astype(np.int64)
+        primes.setflags(write=False)
+        _save_cached_primes(n, primes)
+    return primes
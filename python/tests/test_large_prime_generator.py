@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import Large_Prime_number_Generator as gen
+
+
+def _gmpy2_primes(min_n, max_n, allowed_positions):
+    """Reference: every prime in [min_n, max_n] on an allowed wheel position"""
+    allowed = set(allowed_positions)
+    primes = []
+    p = gen.gmpy2.next_prime(min_n - 1)
+    while p <= max_n:
+        if p % 69 in allowed:
+            primes.append(int(p))
+        p = gen.gmpy2.next_prime(p)
+    return primes
+
+
+@unittest.skipUnless(gen.NUMBA_AVAILABLE and gen.GMPY2_AVAILABLE, "needs numba and gmpy2")
+class ScanTest(unittest.TestCase):
+    def check(self, min_n, max_n, block_rounds):
+        allowed = np.array(gen.HIGH_DIM_POSITIONS, dtype=np.int64)
+        found = gen._scan(min_n, max_n, allowed, block_rounds=block_rounds).tolist()
+        self.assertEqual(found, _gmpy2_primes(min_n, max_n, gen.HIGH_DIM_POSITIONS))
+    
+    def test_just_above_sieve_limit(self):
+        self.check(gen.SIEVE_LIMIT + 1, gen.SIEVE_LIMIT + 200_000, gen.SCAN_BLOCK_ROUNDS)
+    
+    def test_multi_block_range(self):
+        # Block edges fall mid-wheel and the range ends off a wheel boundary
+        self.check(gen.SIEVE_LIMIT + 7, gen.SIEVE_LIMIT + 100_003, 97)
+    
+    def test_near_montgomery_limit(self):
+        self.check(gen.MONTGOMERY_LIMIT - 50_000, gen.MONTGOMERY_LIMIT - 1, 101)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import concurrent.futures
+import multiprocessing
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import primes_core
+import prime_verification_for_Trinity as pvt
+
+_ProcessPoolExecutor = concurrent.futures.ProcessPoolExecutor
+
+
+def setUpModule():
+    # Keep test runs out of the user's prime cache
+    patcher = mock.patch.object(primes_core, 'DISK_CACHE_ENABLED', False)
+    patcher.start()
+    unittest.addModuleCleanup(patcher.stop)
+    unittest.addModuleCleanup(primes_core.primes_up_to.cache_clear)
+    primes_core.primes_up_to.cache_clear()
+
+
+def _disable_numba():
+    """Worker initializer - bin on the NumPy path, like a machine without numba"""
+    pvt.NUMBA_AVAILABLE = False
+
+
+def _spawn_pool(max_workers):
+    # Spawned, not forked: forking after numba's parallel kernels have run in this
+    # process (other test modules) can leave workers deadlocked on inherited locks
+    return _ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'), initializer=_disable_numba)
+
+
+class BinDimensionsTest(unittest.TestCase):
+    DIMENSIONS = list(range(1, 13))
+    
+    def bins(self, workers):
+        suite = pvt.PrimeVerificationSuite(max_n=200_000)
+        suite._bin_dimensions(self.DIMENSIONS, workers=workers)
+        return suite._bin_cache
+    
+    def test_pool_matches_serial(self):
+        # The pool only runs without numba and with enough primes per worker,
+        # so force both and check it merges the same bins as the serial loop
+        with mock.patch.object(pvt, 'NUMBA_AVAILABLE', False), \
+             mock.patch.object(pvt, '_MIN_PRIMES_PER_WORKER', 1), \
+             mock.patch.object(pvt.concurrent.futures, 'ProcessPoolExecutor', side_effect=_spawn_pool) as pool:
+            serial = self.bins(workers=1)
+            pool.assert_not_called()
+            pooled = self.bins(workers=4)
+            pool.assert_called_once_with(max_workers=4)
+        
+        self.assertEqual(sorted(pooled), self.DIMENSIONS)
+        self.assertEqual(sorted(serial), sorted(pooled))
+        for dim in self.DIMENSIONS:
+            self.assertEqual(sorted(serial[dim]), sorted(pooled[dim]))
+            for freq in serial[dim]:
+                with self.subTest(dim=dim, freq=freq):
+                    np.testing.assert_array_equal(pooled[dim][freq], serial[dim][freq])
+
+
+if __name__ == "__main__":
+    unittest.main()
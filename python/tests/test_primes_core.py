@@ -0,0 +1,74 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import primes_core
+
+
+class PrimeCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name) / 'dart69'
+        for patcher in (mock.patch.dict(os.environ, {'XDG_CACHE_HOME': tmp.name}),
+                        mock.patch.object(primes_core, 'DISK_CACHE_ENABLED', True)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.max_n = 100_000
+        self.primes = np.flatnonzero(primes_core.prime_sieve(self.max_n)).astype(np.int64)
+    
+    def path(self):
+        return self.cache_dir / f'dart69_primes_{self.max_n}.npy'
+    
+    def test_round_trip(self):
+        primes_core._save_cached_primes(self.max_n, self.primes)
+        self.assertEqual(sorted(p.name for p in self.cache_dir.iterdir()), [self.path().name])
+        np.testing.assert_array_equal(primes_core._load_cached_primes(self.max_n), self.primes)
+    
+    @unittest.skipUnless(hasattr(os, 'getuid'), "POSIX permissions")
+    def test_cache_dir_is_private(self):
+        primes_core._save_cached_primes(self.max_n, self.primes)
+        self.assertEqual(self.cache_dir.stat().st_mode & 0o777, 0o700)
+    
+    def test_invalid_files_are_rejected(self):
+        self.cache_dir.mkdir()
+        for bad in (self.primes.astype(np.int32), self.primes.reshape(-1, 1), self.primes[:0], self.primes[1:]):
+            np.save(self.path(), bad)
+            with self.subTest(dtype=bad.dtype, shape=bad.shape):
+                self.assertIsNone(primes_core._load_cached_primes(self.max_n))
+    
+    def test_values_above_max_n_are_rejected(self):
+        self.cache_dir.mkdir()
+        np.save(self.path().with_name(f'dart69_primes_{self.max_n - 1000}.npy'), self.primes)
+        self.assertIsNone(primes_core._load_cached_primes(self.max_n - 1000))
+    
+    def test_disabled_cache_stays_off_disk(self):
+        with mock.patch.object(primes_core, 'DISK_CACHE_ENABLED', False):
+            primes_core._save_cached_primes(self.max_n, self.primes)
+            self.assertIsNone(primes_core._load_cached_primes(self.max_n))
+        self.assertFalse(self.cache_dir.exists())
+    
+    def test_no_home_directory(self):
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': ''}), \
+             mock.patch.object(primes_core.Path, 'home', side_effect=RuntimeError):
+            self.assertIsNone(primes_core._prime_cache_dir())
+            primes_core._save_cached_primes(self.max_n, self.primes)
+    
+    def test_primes_up_to_resieves_on_bad_cache(self):
+        self.cache_dir.mkdir()
+        np.save(self.path(), self.primes[1:])
+        primes_core.primes_up_to.cache_clear()
+        self.addCleanup(primes_core.primes_up_to.cache_clear)
+        np.testing.assert_array_equal(primes_core.primes_up_to(self.max_n), self.primes)
+        np.testing.assert_array_equal(primes_core._load_cached_primes(self.max_n), self.primes)
+
+
+if __name__ == "__main__":
+    unittest.main()
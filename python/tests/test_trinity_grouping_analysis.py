@@ -0,0 +1,76 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import primes_core
+import trinity_grouping_analysis as tga
+
+
+def setUpModule():
+    # Keep test runs out of the user's prime cache
+    patcher = mock.patch.object(primes_core, 'DISK_CACHE_ENABLED', False)
+    patcher.start()
+    unittest.addModuleCleanup(patcher.stop)
+    unittest.addModuleCleanup(primes_core.primes_up_to.cache_clear)
+    primes_core.primes_up_to.cache_clear()
+
+
+class SectorBoundaryTest(unittest.TestCase):
+    """Primes that sit exactly on a sector boundary belong to the sector that starts there"""
+    
+    # (dimension, prime, Trinity, sector) - the old float path put each of these one sector lower
+    BOUNDARY_PRIMES = [
+        (3, 17, '69', 23),      # (17 - 10) / (31 - 10) * 69 == 23 exactly
+        (3, 17, '138.5', 46),
+        (6, 743, '69', 46),     # (743 - 307) / (961 - 307) * 69 == 46 exactly
+        (6, 743, '138.5', 92),
+        (14, 4976509, '69', 23),  # (4976509 - 2903678) / (9122171 - 2903678) * 69 == 23 exactly
+    ]
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = tga.TrinityGroupingAnalyzer(max_n=10_000)
+    
+    def sector_of(self, dim, prime, trinity):
+        start, end, _ = self.analyzer._dimension_primes(dim)
+        counts = tga._bin_trinity_sectors(np.array([prime], dtype=np.int64), start, end,
+                                          self.analyzer.trinity_frequencies)[trinity]
+        return counts.index(1)
+    
+    def test_boundary_primes(self):
+        for dim, prime, trinity, sector in self.BOUNDARY_PRIMES:
+            with self.subTest(dim=dim, prime=prime, trinity=trinity):
+                self.assertEqual(self.sector_of(dim, prime, trinity), sector)
+    
+    def test_boundary_primes_numpy_path(self):
+        with mock.patch.object(tga, 'NUMBA_AVAILABLE', False):
+            self.test_boundary_primes()
+    
+    def test_boundary_primes_pure_path(self):
+        for dim, prime, trinity, sector in self.BOUNDARY_PRIMES:
+            start, end, _ = self.analyzer._dimension_primes(dim)
+            info = self.analyzer.trinity_frequencies[trinity]
+            counts = tga._bin_sectors_pure([prime], start, end, info['freq'], info['sectors'])
+            with self.subTest(dim=dim, prime=prime, trinity=trinity):
+                self.assertEqual(counts.index(1), sector)
+    
+    def test_boundary_primes_in_full_dimension(self):
+        # The full D3 and D6 bins count the boundary prime in its own sector
+        for dim, prime, trinity, sector in self.BOUNDARY_PRIMES:
+            if prime > self.analyzer.max_n:
+                continue
+            start, end, primes_in_dim = self.analyzer._dimension_primes(dim)
+            without = np.array([p for p in primes_in_dim if p != prime], dtype=np.int64)
+            full = tga._bin_trinity_sectors(primes_in_dim, start, end, self.analyzer.trinity_frequencies)[trinity]
+            rest = tga._bin_trinity_sectors(without, start, end, self.analyzer.trinity_frequencies)[trinity]
+            with self.subTest(dim=dim, prime=prime, trinity=trinity):
+                self.assertEqual([a - b for a, b in zip(full, rest)].index(1), sector)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,50 +11,181 @@ This bridges the gap between:
 - Observed macro-pattern: 4.2% groupings
 """
 
+import bisect
+import concurrent.futures
+import contextlib
+import io
 import math
+import os
+import platform
+import sys
 import numpy as np
 from collections import defaultdict
 from typing import List, Dict, Tuple
 import itertools
+from primes_core import primes_up_to
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# PyPy's JIT compiles plain Python loops but not NumPy calls, so binning stays in pure Python there
+PYPY = platform.python_implementation() == 'PyPy'
+
+# ⌊π^k⌋ for k = 0..24 - the π-dimension boundaries, computed once
+PI_POW = [math.floor(math.pi ** k) for k in range(25)]
 
 def sieve_of_eratosthenes(n: int) -> List[int]:
     """Generate all primes up to n using Sieve of Eratosthenes"""
     if n < 2:
         return []
     
-    sieve = [True] * (n + 1)
-    sieve[0] = sieve[1] = False
+    if not PYPY:
+        return primes_up_to(n).tolist()
+    
+    # Plain Python loops for PyPy's JIT - odd numbers only: byte k stands for 2k + 1
+    sieve = bytearray(b'\x01') * ((n + 1) // 2)
+    sieve[0] = 0
+    
+    for i in range(3, math.isqrt(n) + 1, 2):
+        if sieve[i >> 1]:
+            # Strike i*i, i*i + 2i, ... in one slice assignment
+            start = i * i >> 1
+            sieve[start::i] = bytes(len(range(start, len(sieve), i)))
+    
+    return [2] + list(itertools.compress(range(1, n + 1, 2), sieve))
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _nb_sector_counts(primes, start, end, half_sectors, num_sectors, counts):
+        """
+        counts[j, s] += primes in sector s of Trinity j - one pass over the primes,
+        same integer sector arithmetic as the NumPy path
+        """
+        span = 2 * (end - start)
+        for j in range(half_sectors.shape[0]):
+            for i in range(primes.shape[0]):
+                sector = min((primes[i] - start) * half_sectors[j] // span, num_sectors[j] - 1)
+                if primes[i] == end:
+                    sector = 0
+                counts[j, sector] += 1
+    
+    @njit(cache=True)
+    def _nb_window_sums(densities, group_size):
+        """Density of every consecutive (wrapping) grouping of group_size sectors, summed in sector order"""
+        num_sectors = densities.shape[0]
+        sums = np.zeros(num_sectors)
+        for start_sector in range(num_sectors):
+            total = 0.0
+            for i in range(group_size):
+                total += densities[(start_sector + i) % num_sectors]
+            sums[start_sector] = total
+        return sums
+
+def _bin_sectors_pure(primes: List[int], start: int, end: int, freq: float, num_sectors: int) -> List[int]:
+    """Per-sector prime counts with plain ints and lists - same integer sector arithmetic as the NumPy path"""
+    counts = [0] * num_sectors
+    half_sectors = round(2 * freq)
+    span = 2 * (end - start)
+    last = num_sectors - 1
+    for p in primes:
+        counts[0 if p == end else min((p - start) * half_sectors // span, last)] += 1
+    return counts
+
+# Below this many primes per worker, process startup and pickling cost more than the binning
+_MIN_PRIMES_PER_WORKER = 1 << 17
+
+def _bin_trinity_sectors(primes_in_dim, start: int, end: int, trinity_frequencies: Dict) -> Dict[str, List[int]]:
+    """
+    Per-sector counts of one dimension's primes (in [start, end]) for every Trinity frequency.
+    The sector of p is floor(relative position * freq), computed in integers as
+    (p - start) * 2freq // 2(end - start) so the 138.5 half-sector stays exact;
+    the endpoint is a full turn and wraps to sector 0, the last sector takes any remainder.
+    """
+    trinities = trinity_frequencies.items()
+    
+    if NUMBA_AVAILABLE:
+        half_sectors = np.array([round(2 * info['freq']) for _, info in trinities], dtype=np.int64)
+        num_sectors = np.array([info['sectors'] for _, info in trinities], dtype=np.int64)
+        counts = np.zeros((len(num_sectors), num_sectors.max()), dtype=np.int64)
+        _nb_sector_counts(primes_in_dim, start, end, half_sectors, num_sectors, counts)
+        return {name: counts[j, :info['sectors']].tolist() for j, (name, info) in enumerate(trinities)}
+    
+    if PYPY:
+        return {
+            name: _bin_sectors_pure(primes_in_dim, start, end, info['freq'], info['sectors'])
+            for name, info in trinities
+        }
     
-    for i in range(2, int(n**0.5) + 1):
-        if sieve[i]:
-            for j in range(i*i, n + 1, i):
-                sieve[j] = False
+    offsets = primes_in_dim - start
+    span = 2 * (end - start)
+    results = {}
+    for name, info in trinities:
+        sectors = np.minimum(offsets * round(2 * info['freq']) // span, info['sectors'] - 1)
+        sectors[primes_in_dim == end] = 0
+        results[name] = np.bincount(sectors, minlength=info['sectors']).tolist()
+    return results
+
+def _target_angle_mappings(angular_quantum: float, target_angles: Tuple[int, ...]) -> Dict:
+    """Trinity sector of each target angle for one angular quantum"""
+    mappings = {}
     
-    return [i for i in range(2, n + 1) if sieve[i]]
+    for target_angle in target_angles:
+        # Find which Trinity sector contains this angle
+        trinity_sector = int(target_angle / angular_quantum)
+        sector_start_angle = trinity_sector * angular_quantum
+        sector_end_angle = (trinity_sector + 1) * angular_quantum
+        
+        mappings[target_angle] = {
+            'trinity_sector': trinity_sector,
+            'sector_angle_range': f"{sector_start_angle:.1f}°-{sector_end_angle:.1f}°",
+            'angle_within_sector': target_angle - sector_start_angle,
+            'sector_coverage': (target_angle - sector_start_angle) / angular_quantum
+        }
+    
+    return mappings
 
 class TrinityGroupingAnalyzer:
+    # Trinity frequencies
+    TRINITY_FREQUENCIES = {
+        '69': {'freq': 69, 'angular_quantum': 360/69, 'sectors': 69},
+        '71': {'freq': 71, 'angular_quantum': 360/71, 'sectors': 71}, 
+        '138.5': {'freq': 138.5, 'angular_quantum': 360/138.5, 'sectors': int(138.5)}
+    }
+    
+    # Target angular preferences from papers
+    TARGET_ANGLES = (150, 330, 225)  # High-consistency sectors
+    
     def __init__(self, max_n: int = 1000000):
         """Initialize with precomputed primes"""
         self.max_n = max_n
         print(f"Generating primes up to {max_n:,}...")
-        self.primes = sieve_of_eratosthenes(max_n)
+        # Sorted array for binary-search slicing and vectorized binning - shared with any
+        # other analysis in this process and cached on disk
+        self.primes_np = primes_up_to(max_n)
+        self.primes = self.primes_np.tolist()
+        # dim -> (start, end, primes in [start, end]), shared by all Trinity frequencies
+        self._dim_slices = {}
+        # dim -> {trinity_name: per-sector prime counts}
+        self._bin_cache = {}
         print(f"Generated {len(self.primes):,} primes for Trinity grouping analysis")
         
-        # Trinity frequencies
-        self.trinity_frequencies = {
-            '69': {'freq': 69, 'angular_quantum': 360/69, 'sectors': 69},
-            '71': {'freq': 71, 'angular_quantum': 360/71, 'sectors': 71}, 
-            '138.5': {'freq': 138.5, 'angular_quantum': 360/138.5, 'sectors': int(138.5)}
-        }
-        
-        # Target angular preferences from papers
-        self.target_angles = [150, 330, 225]  # High-consistency sectors
+        # Per-instance copies, so changing them never touches the class defaults
+        self.trinity_frequencies = {name: dict(info) for name, info in self.TRINITY_FREQUENCIES.items()}
+        self.target_angles = list(self.TARGET_ANGLES)
         
-    def analyze_trinity_groupings(self, dimensions: List[int] = [7, 8, 9, 10, 11, 12]) -> Dict:
-        """Analyze Trinity sector groupings for 4.2% pattern"""
+    def analyze_trinity_groupings(self, dimensions: List[int] = [7, 8, 9, 10, 11, 12], workers: int = None) -> Dict:
+        """
+        Analyze Trinity sector groupings for 4.2% pattern
+        workers: processes for binning the dimensions (default: one per CPU)
+        """
         print("TRINITY SECTOR GROUPING ANALYSIS")
         print("=" * 50)
         
+        self._bin_dimensions(dimensions, workers)
+        
         results = {}
         
         for trinity_name, trinity_info in self.trinity_frequencies.items():
@@ -88,14 +219,62 @@ class TrinityGroupingAnalyzer:
         
         return results
     
+    def _dimension_primes(self, dim: int) -> Tuple[int, int, np.ndarray]:
+        """(start, end, primes) for π-dimension dim - primes is a view of the sorted prime array"""
+        if dim not in self._dim_slices:
+            if 0 <= dim < len(PI_POW):
+                start = PI_POW[dim-1] + 1 if dim > 1 else 1
+                end = PI_POW[dim]
+            else:
+                start = math.floor(math.pi ** (dim-1)) + 1
+                end = math.floor(math.pi ** dim)
+            lo = np.searchsorted(self.primes_np, start)
+            hi = np.searchsorted(self.primes_np, end, side='right')
+            self._dim_slices[dim] = (start, end, self.primes_np[lo:hi])
+        return self._dim_slices[dim]
+    
+    def _dimension_primes_for_binning(self, dim: int):
+        """(start, end, primes) of dimension dim - a plain list slice under PyPy, else the NumPy view"""
+        start, end, primes_in_dim = self._dimension_primes(dim)
+        if PYPY:
+            primes_in_dim = self.primes[bisect.bisect_left(self.primes, start):bisect.bisect_right(self.primes, end)]
+        return start, end, primes_in_dim
+    
+    def _bin_dimension(self, dim: int) -> Dict[str, List[int]]:
+        """Per-sector prime counts of dimension dim for every Trinity frequency"""
+        if dim not in self._bin_cache:
+            start, end, primes_in_dim = self._dimension_primes_for_binning(dim)
+            self._bin_cache[dim] = _bin_trinity_sectors(primes_in_dim, start, end, self.trinity_frequencies)
+        return self._bin_cache[dim]
+    
+    def _bin_dimensions(self, dimensions: List[int], workers: int = None):
+        """Fill the bin cache for several dimensions, one dimension per worker process"""
+        slices = {dim: self._dimension_primes_for_binning(dim) for dim in dict.fromkeys(dimensions)
+                  if dim not in self._bin_cache}
+        # Dimensions without primes are skipped by the analysis and never binned
+        slices = {dim: bounds for dim, bounds in slices.items() if len(bounds[2])}
+        total_primes = sum(len(primes_in_dim) for _, _, primes_in_dim in slices.values())
+        workers = min(workers or os.cpu_count() or 1, len(slices), total_primes // _MIN_PRIMES_PER_WORKER)
+        if workers < 2:
+            for dim in slices:
+                self._bin_dimension(dim)
+            return
+        
+        # Workers get only their dimension's slice of the primes, never self
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                dim: pool.submit(_bin_trinity_sectors, primes_in_dim, start, end, self.trinity_frequencies)
+                for dim, (start, end, primes_in_dim) in slices.items()
+            }
+            for dim, future in futures.items():
+                self._bin_cache[dim] = future.result()
+        finally:
+            pool.shutdown()
+    
     def _analyze_dimension_groupings(self, dim: int, trinity_name: str, trinity_info: Dict) -> Dict:
         """Analyze Trinity sector groupings for a specific dimension"""
-        # Calculate dimension boundaries
-        start = math.floor(math.pi ** (dim-1)) + 1 if dim > 1 else 1
-        end = math.floor(math.pi ** dim)
-        
-        # Find primes in this dimension
-        primes_in_dim = [p for p in self.primes if start <= p <= end and p <= self.max_n]
+        start, end, primes_in_dim = self._dimension_primes(dim)
         
         if len(primes_in_dim) == 0:
             return None
@@ -104,14 +283,7 @@ class TrinityGroupingAnalyzer:
         num_sectors = trinity_info['sectors']
         
         # Calculate Trinity sector densities
-        sector_counts = [0] * num_sectors
-        
-        for p in primes_in_dim:
-            relative_pos = (p - start) / (end - start)
-            angle = relative_pos * 2 * math.pi
-            angle_degrees = (angle * 180 / math.pi) % 360
-            sector = min(int(angle_degrees / angular_quantum), num_sectors - 1)
-            sector_counts[sector] += 1
+        sector_counts = self._bin_dimension(dim)[trinity_name]
         
         total_primes = len(primes_in_dim)
         sector_densities = [(count / total_primes * 100) for count in sector_counts]
@@ -119,22 +291,30 @@ class TrinityGroupingAnalyzer:
         # Test different grouping sizes
         grouping_results = {}
         
+        densities = np.array(sector_densities)
+        
         for group_size in [2, 3, 4, 5]:
             groups_near_4_2 = []
             
-            # Test all possible consecutive groupings of this size
-            for start_sector in range(num_sectors):
+            # Density of every consecutive (wrapping) grouping of this size at once -
+            # the shifted densities are added in sector order, exactly like sum()
+            if NUMBA_AVAILABLE:
+                window_sums = _nb_window_sums(densities, group_size)
+            else:
+                window_sums = np.zeros(num_sectors)
+                for i in range(group_size):
+                    window_sums += np.roll(densities, -i)
+            
+            # Only groupings near 4.2% (within 0.5%) are built
+            hits = np.flatnonzero(np.abs(window_sums - 4.2) < 0.5).tolist()
+            for start_sector, group_density in zip(hits, window_sums[hits].tolist()):
                 group_sectors = [(start_sector + i) % num_sectors for i in range(group_size)]
-                group_density = sum(sector_densities[s] for s in group_sectors)
-                
-                # Check if this grouping is near 4.2%
-                if abs(group_density - 4.2) < 0.5:  # Within 0.5% of 4.2%
-                    groups_near_4_2.append({
-                        'sectors': group_sectors,
-                        'density': group_density,
-                        'angle_range': f"{group_sectors[0] * angular_quantum:.1f}°-{((group_sectors[-1] + 1) % num_sectors) * angular_quantum:.1f}°",
-                        'center_angle': (sum(s * angular_quantum for s in group_sectors) / group_size) % 360
-                    })
+                groups_near_4_2.append({
+                    'sectors': group_sectors,
+                    'density': group_density,
+                    'angle_range': f"{group_sectors[0] * angular_quantum:.1f}°-{((group_sectors[-1] + 1) % num_sectors) * angular_quantum:.1f}°",
+                    'center_angle': (sum(s * angular_quantum for s in group_sectors) / group_size) % 360
+                })
             
             grouping_results[group_size] = {
                 'count': len(groups_near_4_2),
@@ -176,16 +356,21 @@ class TrinityGroupingAnalyzer:
                 'cross_dim_analysis': {}
             }
             
-            # Collect data across dimensions
-            counts_per_dim = []
-            percentages_per_dim = []
+            # Running count total and mean/variance of the percentages (Welford) - one pass, no lists
+            n = 0
+            count_sum = 0
+            mean_percentage = 0.0
+            m2_percentage = 0.0
             
             for dim, data in dimensions_data.items():
                 if group_size in data['grouping_results']:
                     count = data['grouping_results'][group_size]['count']
                     percentage = data['grouping_results'][group_size]['percentage']
-                    counts_per_dim.append(count)
-                    percentages_per_dim.append(percentage)
+                    n += 1
+                    count_sum += count
+                    delta = percentage - mean_percentage
+                    mean_percentage += delta / n
+                    m2_percentage += delta * (percentage - mean_percentage)
                     
                     pattern_data['cross_dim_analysis'][dim] = {
                         'count': count,
@@ -193,34 +378,24 @@ class TrinityGroupingAnalyzer:
                         'groups': data['grouping_results'][group_size]['groups']
                     }
             
-            if counts_per_dim:
-                pattern_data['avg_groups_per_dim'] = np.mean(counts_per_dim)
-                pattern_data['consistency_score'] = 1 - (np.std(percentages_per_dim) / np.mean(percentages_per_dim)) if np.mean(percentages_per_dim) > 0 else 0
-                pattern_data['best_dimensions'] = [dim for dim, count in zip(dimensions_data.keys(), counts_per_dim) if count >= np.mean(counts_per_dim)]
+            if n:
+                avg_count = count_sum / n
+                std_percentage = math.sqrt(m2_percentage / n)
+                pattern_data['avg_groups_per_dim'] = avg_count
+                pattern_data['consistency_score'] = 1 - (std_percentage / mean_percentage) if mean_percentage > 0 else 0
+                pattern_data['best_dimensions'] = [dim for dim, analysis in pattern_data['cross_dim_analysis'].items()
+                                                   if analysis['count'] >= avg_count]
             
             patterns[group_size] = pattern_data
         
         return patterns
     
     def _map_target_angles_to_trinity(self, trinity_info: Dict) -> Dict:
-        """Map target angles (150°, 330°, 225°) to Trinity sectors"""
-        angular_quantum = trinity_info['angular_quantum']
-        mappings = {}
-        
-        for target_angle in self.target_angles:
-            # Find which Trinity sector contains this angle
-            trinity_sector = int(target_angle / angular_quantum)
-            sector_start_angle = trinity_sector * angular_quantum
-            sector_end_angle = (trinity_sector + 1) * angular_quantum
-            
-            mappings[target_angle] = {
-                'trinity_sector': trinity_sector,
-                'sector_angle_range': f"{sector_start_angle:.1f}°-{sector_end_angle:.1f}°",
-                'angle_within_sector': target_angle - sector_start_angle,
-                'sector_coverage': (target_angle - sector_start_angle) / angular_quantum
-            }
-        
-        return mappings
+        """Map target angles (150°, 330°, 225°) to Trinity sectors - precomputed for the defaults"""
+        key = (trinity_info['angular_quantum'], tuple(self.target_angles))
+        if key in _PRECOMPUTED_MAPPINGS:
+            return _PRECOMPUTED_MAPPINGS[key]
+        return _target_angle_mappings(*key)
     
     def find_optimal_trinity_groupings(self, results: Dict) -> Dict:
         """Find the optimal Trinity frequency and grouping size for 4.2% pattern"""
@@ -330,6 +505,14 @@ class TrinityGroupingAnalyzer:
         
         return coverage_analysis
 
+# Target angle mappings of the default Trinity frequencies, evaluated once at import -
+# shared by every analyzer and result, so treat them as read-only
+_PRECOMPUTED_MAPPINGS = {
+    (info['angular_quantum'], TrinityGroupingAnalyzer.TARGET_ANGLES):
+        _target_angle_mappings(info['angular_quantum'], TrinityGroupingAnalyzer.TARGET_ANGLES)
+    for info in TrinityGroupingAnalyzer.TRINITY_FREQUENCIES.values()
+}
+
 def run_trinity_grouping_analysis():
     """Main function to run complete Trinity grouping analysis"""
     print("TRINITY SECTOR GROUPING ANALYSIS")
@@ -350,32 +533,36 @@ def run_trinity_grouping_analysis():
     coverage_analysis = analyzer.analyze_target_angle_coverage(results, optimal_analysis)
     
     # Step 4: Summary and conclusions
-    print(f"\n" + "=" * 60)
-    print("TRINITY GROUPING CONCLUSIONS")
-    print("=" * 60)
-    
-    # Find best overall Trinity frequency
-    best_trinity = max(optimal_analysis.keys(), 
-                      key=lambda k: optimal_analysis[k]['best_score'] if optimal_analysis[k]['best_score'] else 0)
-    
-    print(f"\n🎯 BEST TRINITY FREQUENCY FOR 4.2% PATTERN:")
-    print(f"   Trinity-{best_trinity}")
-    print(f"   Angular quantum: {analyzer.trinity_frequencies[best_trinity]['angular_quantum']:.3f}° per sector")
-    print(f"   Optimal group size: {optimal_analysis[best_trinity]['best_group_size']} sectors")
-    print(f"   Expected group density: {analyzer.trinity_frequencies[best_trinity]['angular_quantum'] * optimal_analysis[best_trinity]['best_group_size'] / 360 * 100:.2f}%")
-    
-    print(f"\n📐 TARGET ANGLE EXPLANATION:")
-    for target_angle in analyzer.target_angles:
-        trinity_sector = int(target_angle / analyzer.trinity_frequencies[best_trinity]['angular_quantum'])
-        print(f"   {target_angle}° → Trinity-{best_trinity} sector {trinity_sector}")
-    
-    print(f"\n🔗 BRIDGING THE GAP:")
-    individual_density = 100 / analyzer.trinity_frequencies[best_trinity]['sectors']
-    group_density = individual_density * optimal_analysis[best_trinity]['best_group_size']
-    print(f"   Individual Trinity-{best_trinity} sector: {individual_density:.3f}%")
-    print(f"   {optimal_analysis[best_trinity]['best_group_size']}-sector grouping: {group_density:.3f}%")
-    print(f"   JavaScript observed: 4.2%")
-    print(f"   Match quality: {abs(group_density - 4.2) < 0.5}")
+    # Build the summary in memory and write it in one go
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        print(f"\n" + "=" * 60)
+        print("TRINITY GROUPING CONCLUSIONS")
+        print("=" * 60)
+        
+        # Find best overall Trinity frequency
+        best_trinity = max(optimal_analysis.keys(), 
+                          key=lambda k: optimal_analysis[k]['best_score'] if optimal_analysis[k]['best_score'] else 0)
+        
+        print(f"\n🎯 BEST TRINITY FREQUENCY FOR 4.2% PATTERN:")
+        print(f"   Trinity-{best_trinity}")
+        print(f"   Angular quantum: {analyzer.trinity_frequencies[best_trinity]['angular_quantum']:.3f}° per sector")
+        print(f"   Optimal group size: {optimal_analysis[best_trinity]['best_group_size']} sectors")
+        print(f"   Expected group density: {analyzer.trinity_frequencies[best_trinity]['angular_quantum'] * optimal_analysis[best_trinity]['best_group_size'] / 360 * 100:.2f}%")
+        
+        print(f"\n📐 TARGET ANGLE EXPLANATION:")
+        for target_angle in analyzer.target_angles:
+            trinity_sector = int(target_angle / analyzer.trinity_frequencies[best_trinity]['angular_quantum'])
+            print(f"   {target_angle}° → Trinity-{best_trinity} sector {trinity_sector}")
+        
+        print(f"\n🔗 BRIDGING THE GAP:")
+        individual_density = 100 / analyzer.trinity_frequencies[best_trinity]['sectors']
+        group_density = individual_density * optimal_analysis[best_trinity]['best_group_size']
+        print(f"   Individual Trinity-{best_trinity} sector: {individual_density:.3f}%")
+        print(f"   {optimal_analysis[best_trinity]['best_group_size']}-sector grouping: {group_density:.3f}%")
+        print(f"   JavaScript observed: 4.2%")
+        print(f"   Match quality: {abs(group_density - 4.2) < 0.5}")
+    sys.stdout.write(output.getvalue())
     
     return results, optimal_analysis, coverage_analysis
 